@@ -42,10 +42,9 @@ DEBUG_EXIST_DISAPPEAR = False
 S_OK = 0
 
 IsPy38OrHigher = sys.version_info[:2] >= (3, 8)
-IsNT6orHigher = os.sys.getwindowsversion().major >= 6
-CurrentProcessIs64Bit = sys.maxsize > 0xFFFFFFFF
-ProcessTime = time.perf_counter  # this returns nearly 0 when first call it if python version <= 3.6
-ProcessTime()  # need to call it once if python version <= 3.6
+IsNT6orHigher = sys.getwindowsversion().major >= 6
+CurrentProcessIs64Bit = sys.maxsize.bit_length() > 32
+ProcessTime = time.perf_counter
 TreeNode = Any
 
 class Control():
@@ -2564,7 +2563,7 @@ class ComboBoxControl(Control):
         """
         expandCollapsePattern = self.GetExpandCollapsePattern()
         if expandCollapsePattern:
-            expandCollapsePattern.Expand()
+            expandCollapsePattern.Expand(OPERATION_WAIT_TIME)
         else:
             # Windows Form's ComboBoxControl doesn't support ExpandCollapsePattern
             self.Click(x=-10, ratioY=0.5, simulateMove=simulateMove)
@@ -3320,7 +3319,7 @@ class TopLevel():
                 x = 0
             if y < 0:
                 y = 0
-            return SetWindowPos(self.NativeWindowHandle, SWP.HWND_Top, x, y, 0, 0, SWP.SWP_NoSize)
+            return SetWindowPos(self.NativeWindowHandle, HWNDInsertAfter.HWND_Top, x, y, 0, 0, SWP.SWP_NoSize)
         return False
 
     def SetActive(self, waitTime: float = OPERATION_WAIT_TIME) -> bool:
@@ -4526,13 +4525,13 @@ def LogControl(control: Control, depth: int = 0, showAllName: bool = True, showP
             Logger.Write(pt.Value, ConsoleColor.DarkGreen)
         elif isinstance(pt, TogglePattern):
             Logger.Write('    TogglePattern.ToggleState: ')
-            Logger.Write('ToggleState.' + _GetDictKeyName(ToggleState.__dict__, pt.ToggleState), ConsoleColor.DarkGreen)
+            Logger.Write('ToggleState.' + _GetDictKeyName(ToggleState.__members__, pt.ToggleState), ConsoleColor.DarkGreen)
         elif isinstance(pt, SelectionItemPattern):
             Logger.Write('    SelectionItemPattern.IsSelected: ')
             Logger.Write(pt.IsSelected, ConsoleColor.DarkGreen)
         elif isinstance(pt, ExpandCollapsePattern):
             Logger.Write('    ExpandCollapsePattern.ExpandCollapseState: ')
-            Logger.Write('ExpandCollapseState.' + _GetDictKeyName(ExpandCollapseState.__dict__, pt.ExpandCollapseState), ConsoleColor.DarkGreen)
+            Logger.Write('ExpandCollapseState.' + _GetDictKeyName(ExpandCollapseState.__members__, pt.ExpandCollapseState), ConsoleColor.DarkGreen)
         elif isinstance(pt, ScrollPattern):
             Logger.Write('    ScrollPattern.HorizontalScrollPercent: ')
             Logger.Write(pt.HorizontalScrollPercent, ConsoleColor.DarkGreen)
@@ -4666,17 +4665,12 @@ def RunByHotKey(keyFunctions: Dict[Tuple[int, int], Callable], stopHotKey: Optio
     """
     import traceback
 
-    def getModName(theDict, theValue):
-        name = ''
-        for key in theDict:
-            if isinstance(theDict[key], int) and theValue & theDict[key]:
-                if name:
-                    name += '|'
-                name += key
-        return name
+    def getModName(theValue):
+        # iterating an IntFlag value yields only the flags set in it
+        return '|'.join(flag.name for flag in ModifierKey(theValue))
 
     def releaseAllKeys():
-        for key, value in Keys.__dict__.items():
+        for key, value in Keys.__members__.items():
             if isinstance(value, int) and key.startswith('VK'):
                 if IsKeyPressed(value):
                     ReleaseKey(value)
@@ -4707,8 +4701,8 @@ def RunByHotKey(keyFunctions: Dict[Tuple[int, int], Callable], stopHotKey: Optio
         id2HotKey[hotKeyId] = hotkey
         id2Function[hotKeyId] = keyFunctions[hotkey]
         id2Thread[hotKeyId] = None
-        modName = getModName(ModifierKey.__dict__, hotkey[0])
-        keyName = _GetDictKeyName(Keys.__dict__, hotkey[1])
+        modName = getModName(hotkey[0])
+        keyName = VK_TO_NAME.get(hotkey[1], '')
         id2Name[hotKeyId] = str((modName, keyName))
         if ctypes.windll.user32.RegisterHotKey(0, hotKeyId, hotkey[0], hotkey[1]):
             Logger.ColorfullyWrite('Register hotkey <Color=Cyan>{}</Color> successfully\n'.format((modName, keyName)), writeToFile=False)
@@ -4717,8 +4711,8 @@ def RunByHotKey(keyFunctions: Dict[Tuple[int, int], Callable], stopHotKey: Optio
             Logger.ColorfullyWrite('Register hotkey <Color=Cyan>{}</Color> unsuccessfully, maybe it was allready registered by another program\n'.format((modName, keyName)), writeToFile=False)
         hotKeyId += 1
     if stopHotKey and len(stopHotKey) == 2:
-        modName = getModName(ModifierKey.__dict__, stopHotKey[0])
-        keyName = _GetDictKeyName(Keys.__dict__, stopHotKey[1])
+        modName = getModName(stopHotKey[0])
+        keyName = VK_TO_NAME.get(stopHotKey[1], '')
         if ctypes.windll.user32.RegisterHotKey(0, stopHotKeyId, stopHotKey[0], stopHotKey[1]):
             Logger.ColorfullyWrite('Register stop hotkey <Color=DarkYellow>{}</Color> successfully\n'.format((modName, keyName)), writeToFile=False)
         else:
@@ -4727,8 +4721,8 @@ def RunByHotKey(keyFunctions: Dict[Tuple[int, int], Callable], stopHotKey: Optio
     if not registed:
         return
     if exitHotKey and len(exitHotKey) == 2:
-        modName = getModName(ModifierKey.__dict__, exitHotKey[0])
-        keyName = _GetDictKeyName(Keys.__dict__, exitHotKey[1])
+        modName = getModName(exitHotKey[0])
+        keyName = VK_TO_NAME.get(exitHotKey[1], '')
         if ctypes.windll.user32.RegisterHotKey(0, exitHotKeyId, exitHotKey[0], exitHotKey[1]):
             Logger.ColorfullyWrite('Register exit hotkey <Color=DarkYellow>{}</Color> successfully\n'.format((modName, keyName)), writeToFile=False)
         else:
@@ -22,10 +22,11 @@ import atexit
 import threading
 import ctypes
 import ctypes.wintypes
+import functools
 import comtypes
 import comtypes.client
 from io import TextIOWrapper
-from typing import (Any, Callable, Dict, Generator, List, Tuple, Optional, Union, Sequence)
+from typing import (Any, Callable, Dict, Generator, Iterable, List, Tuple, Optional, Union, Sequence)
 
 
 METRO_WINDOW_CLASS_NAME = 'Windows.UI.Core.CoreWindow'  # for Windows 8 and 8.1
@@ -39,10 +40,9 @@ DEBUG_EXIST_DISAPPEAR = False
 S_OK = 0
 
 IsPy38OrHigher = sys.version_info[:2] >= (3, 8)
-IsNT6orHigher = os.sys.getwindowsversion().major >= 6
-CurrentProcessIs64Bit = sys.maxsize > 0xFFFFFFFF
-ProcessTime = time.perf_counter  # this returns nearly 0 when first call it if python version <= 3.6
-ProcessTime()  # need to call it once if python version <= 3.6
+IsNT6orHigher = sys.getwindowsversion().major >= 6
+CurrentProcessIs64Bit = sys.maxsize.bit_length() > 32
+ProcessTime = time.perf_counter
 TreeNode = Any
 from .enums import *
 import ctypes.wintypes
@@ -149,17 +149,72 @@ class _DllClient:
             self.dll.BitmapResize.restype = ctypes.c_size_t
             self.dll.BitmapRotate.restype = ctypes.c_size_t
             self.dll.BitmapGetPixel.restype = ctypes.c_uint32
+            self._SetArgTypes()
             self.dll.Initialize()
         else:
             self.dll = None
             Logger.WriteLine('Can not load dll.\nFunctionalities related to Bitmap are not available.\nYou may need to install Microsoft Visual C++ 2015 Redistributable Package.', ConsoleColor.Yellow)
 
+    def _SetArgTypes(self) -> None:
+        """
+        Declare argtypes(and the missing restypes) of the dll functions used by Bitmap,
+        so ctypes converts arguments by the declared types instead of guessing each one at call time.
+        """
+        dll = self.dll
+        c_int, c_uint32, c_size_t = ctypes.c_int, ctypes.c_uint32, ctypes.c_size_t
+        PUINT32 = ctypes.POINTER(c_uint32)
+        dll.BitmapCreate.argtypes = [c_int, c_int]
+        dll.BitmapRelease.argtypes = [c_size_t]
+        dll.BitmapGetWidthAndHeight.argtypes = [c_size_t]
+        dll.BitmapGetRawFormat.argtypes = [c_size_t, ctypes.POINTER(ctypes.c_uint)]
+        dll.BitmapGetRawFormat.restype = c_int
+        dll.BitmapFromWindow.argtypes = [c_size_t, c_int, c_int, c_int, c_int, c_int, c_int, c_int]
+        dll.BitmapFromHBITMAP.argtypes = [c_size_t, c_int, c_int, c_int, c_int]
+        dll.BitmapToHBITMAP.argtypes = [c_size_t, c_uint32]
+        dll.BitmapFromFile.argtypes = [ctypes.c_wchar_p]
+        dll.BitmapGetPixel.argtypes = [c_size_t, c_int, c_int]
+        dll.BitmapSetPixel.argtypes = [c_size_t, c_int, c_int, c_uint32]
+        dll.BitmapSetPixel.restype = c_int
+        for func in (dll.BitmapGetPixelsHorizontally, dll.BitmapSetPixelsHorizontally,
+                     dll.BitmapGetPixelsVertically, dll.BitmapSetPixelsVertically):
+            func.argtypes = [c_size_t, c_int, c_int, PUINT32, c_int]
+            func.restype = c_int
+        for func in (dll.BitmapGetPixelsOfRect, dll.BitmapSetPixelsOfRect):
+            func.argtypes = [c_size_t, c_int, c_int, c_int, c_int, PUINT32]
+            func.restype = c_int
+        dll.BitmapClone.argtypes = [c_size_t, c_int, c_int, c_int, c_int]
+        dll.BitmapClone.restype = c_size_t
+        dll.BitmapResize.argtypes = [c_size_t, c_int, c_int]
+        dll.BitmapRotate.argtypes = [c_size_t, ctypes.c_float, c_uint32]
+        dll.BitmapRotateFlip.argtypes = [c_size_t, c_int]
+        dll.BitmapRotateFlip.restype = c_int
+        dll.BitmapRotateWithSameSize.argtypes = [c_size_t, ctypes.c_float, ctypes.c_float, ctypes.c_float, c_uint32]
+        dll.BitmapRotateWithSameSize.restype = c_size_t
+        dll.MultiBitmapGetFrameCount.argtypes = [c_size_t]
+        dll.MultiBitmapGetFrameCount.restype = ctypes.c_uint
+        dll.MultiBitmapSelectActiveFrame.argtypes = [c_size_t, ctypes.c_uint]
+        dll.MultiBitmapSelectActiveFrame.restype = c_int
+        dll.MultiBitmapGetFrameDelaySize.argtypes = [c_size_t]
+        dll.MultiBitmapGetFrameDelaySize.restype = ctypes.c_uint
+        dll.MultiBitmapGetFrameDelay.argtypes = [c_size_t, ctypes.c_void_p, ctypes.c_uint, ctypes.POINTER(c_int)]
+        dll.MultiBitmapGetFrameDelay.restype = c_int
+        dll.MultiBitmapToFile.argtypes = [ctypes.POINTER(c_size_t), PUINT32, ctypes.c_uint, ctypes.c_wchar_p, ctypes.c_wchar_p]
+        dll.MultiBitmapToFile.restype = c_int
+        dll.SaveGif.argtypes = [ctypes.POINTER(c_size_t), PUINT32, ctypes.c_uint, ctypes.c_wchar_p]
+        dll.SaveGif.restype = c_int
+
     def __del__(self):
         if self.dll:
             self.dll.Uninitialize()
 
 
-# set Windows dll restype
+@functools.lru_cache(maxsize=None)
+def _BitmapDll() -> ctypes.CDLL:
+    """Return the loaded dll for Bitmap's per pixel methods, skips the `_DllClient.instance()` lookup after the first call."""
+    return _DllClient.instance().dll
+
+
+# set Windows dll argtypes and restype
 ctypes.windll.user32.GetAncestor.restype = ctypes.c_void_p
 ctypes.windll.user32.GetClipboardData.restype = ctypes.c_void_p
 ctypes.windll.user32.GetDC.restype = ctypes.c_void_p
@@ -178,6 +233,42 @@ ctypes.windll.kernel32.GlobalAlloc.restype = ctypes.c_void_p
 ctypes.windll.kernel32.GlobalLock.restype = ctypes.c_void_p
 ctypes.windll.kernel32.OpenProcess.restype = ctypes.c_void_p
 ctypes.windll.ntdll.NtQueryInformationProcess.restype = ctypes.c_uint32
+# functions used by the clipboard helpers, prototyped on private dll instances,
+# ctypes.windll.* function objects are shared by every module in the process
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_gdi32 = ctypes.WinDLL('gdi32', use_last_error=True)
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_user32.GetClipboardData.restype = ctypes.c_void_p
+_user32.GetDC.restype = ctypes.c_void_p
+_gdi32.CreateBitmap.restype = ctypes.c_void_p
+_gdi32.CreateCompatibleDC.restype = ctypes.c_void_p
+_gdi32.SelectObject.restype = ctypes.c_void_p
+_kernel32.GlobalAlloc.restype = ctypes.c_void_p
+_kernel32.GlobalLock.restype = ctypes.c_void_p
+_user32.OpenClipboard.argtypes = [ctypes.c_void_p]
+_user32.CloseClipboard.argtypes = []
+_user32.EmptyClipboard.argtypes = []
+_user32.EnumClipboardFormats.argtypes = [ctypes.wintypes.UINT]
+_user32.EnumClipboardFormats.restype = ctypes.wintypes.UINT
+_user32.GetClipboardFormatNameW.argtypes = [ctypes.wintypes.UINT, ctypes.wintypes.LPWSTR, ctypes.c_int]
+_user32.IsClipboardFormatAvailable.argtypes = [ctypes.wintypes.UINT]
+_user32.GetClipboardData.argtypes = [ctypes.wintypes.UINT]
+_user32.SetClipboardData.argtypes = [ctypes.wintypes.UINT, ctypes.c_void_p]
+_user32.SetClipboardData.restype = ctypes.c_void_p
+_user32.GetDC.argtypes = [ctypes.c_void_p]
+_user32.ReleaseDC.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+_gdi32.CreateBitmap.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.wintypes.UINT, ctypes.wintypes.UINT, ctypes.c_void_p]
+_gdi32.CreateCompatibleDC.argtypes = [ctypes.c_void_p]
+_gdi32.SelectObject.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+_gdi32.BitBlt.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                          ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.wintypes.DWORD]
+_gdi32.DeleteDC.argtypes = [ctypes.c_void_p]
+_gdi32.DeleteObject.argtypes = [ctypes.c_void_p]
+_kernel32.GlobalAlloc.argtypes = [ctypes.wintypes.UINT, ctypes.c_size_t]
+_kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+_kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+_kernel32.GlobalFree.argtypes = [ctypes.c_void_p]
+_kernel32.GlobalFree.restype = ctypes.c_void_p
 
 
 def _GetDictKeyName(theDict: Dict[str, Any], theValue: Any, keyCondition: Optional[Callable[[str], bool]] = None) -> str:
@@ -588,8 +679,8 @@ def GetMonitorsRect() -> List[Rect]:
     rects = []
 
     def MonitorCallback(hMonitor: int, hdcMonitor: int, lprcMonitor: ctypes.POINTER(ctypes.wintypes.RECT), dwData: int):
-        rect = Rect(lprcMonitor.contents.left, lprcMonitor.contents.top, lprcMonitor.contents.right, lprcMonitor.contents.bottom)
-        rects.append(rect)
+        rc = lprcMonitor.contents
+        rects.append(Rect(rc.left, rc.top, rc.right, rc.bottom))
         return 1
     ret = ctypes.windll.user32.EnumDisplayMonitors(ctypes.c_void_p(0), ctypes.c_void_p(0), MonitorEnumProc(MonitorCallback), 0)
     return rects
@@ -623,7 +714,7 @@ def MessageBox(content: str, title: str, flags: int = MB.Ok) -> int:
     content: str.
     title: str.
     flags: int, a value or some combined values in class `MB`.
-    Return int, a value in MB whose name starts with Id, such as MB.IdOk
+    Return int, a value in class `MBResult`, such as MBResult.IdOk
     """
     return ctypes.windll.user32.MessageBoxW(ctypes.c_void_p(0), ctypes.c_wchar_p(content), ctypes.c_wchar_p(title), ctypes.c_uint(flags))
 
@@ -661,7 +752,7 @@ def GetAncestor(handle: int, flag: int) -> int:
     index: int, a value in class `GAFlag`.
     Return int, a native window handle.
     """
-    return ctypes.windll.user32.GetAncestor(ctypes.c_void_p(handle), ctypes.c_int(flag))
+    return ctypes.windll.user32.GetAncestor(ctypes.c_void_p(handle), flag)
 
 
 def IsTopLevelWindow(handle: int) -> bool:
@@ -680,7 +771,7 @@ def GetWindowLong(handle: int, index: int) -> int:
     handle: int, the handle of a native window.
     index: int.
     """
-    return ctypes.windll.user32.GetWindowLongW(ctypes.c_void_p(handle), ctypes.c_int(index))
+    return ctypes.windll.user32.GetWindowLongW(ctypes.c_void_p(handle), index)
 
 
 def SetWindowLong(handle: int, index: int, value: int) -> int:
@@ -730,7 +821,7 @@ def ShowWindow(handle: int, cmdShow: int) -> bool:
     cmdShow: int, a value in clas `SW`.
     Return bool, True if succeed otherwise False.
     """
-    return bool(ctypes.windll.user32.ShowWindow(ctypes.c_void_p(handle), ctypes.c_int(cmdShow)))
+    return bool(ctypes.windll.user32.ShowWindow(ctypes.c_void_p(handle), cmdShow))
 
 
 def MoveWindow(handle: int, x: int, y: int, width: int, height: int, repaint: int = 1) -> bool:
@@ -751,7 +842,7 @@ def SetWindowPos(handle: int, hWndInsertAfter: int, x: int, y: int, width: int,
     """
     SetWindowPos from Win32.
     handle: int, the handle of a native window.
-    hWndInsertAfter: int, a value whose name starts with 'HWND' in class SWP.
+    hWndInsertAfter: int, a value in class `HWNDInsertAfter`.
     x: int.
     y: int.
     width: int.
@@ -768,7 +859,7 @@ def SetWindowTopmost(handle: int, isTopmost: bool) -> bool:
     isTopmost: bool
     Return bool, True if succeed otherwise False.
     """
-    topValue = SWP.HWND_Topmost if isTopmost else SWP.HWND_NoTopmost
+    topValue = HWNDInsertAfter.HWND_Topmost if isTopmost else HWNDInsertAfter.HWND_NoTopmost
     return SetWindowPos(handle, topValue, 0, 0, 0, 0, SWP.SWP_NoSize | SWP.SWP_NoMove)
 
 
@@ -991,8 +1082,8 @@ def SendKey(key: int, waitTime: float = OPERATION_WAIT_TIME) -> None:
     Simulate typing a key.
     key: int, a value in class `Keys`.
     """
-    keybd_event(key, 0, KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey, 0)
-    keybd_event(key, 0, KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey, 0)
+    keybd_event(key, 0, KEY_DOWN_EXTENDED, 0)
+    keybd_event(key, 0, KEY_UP_EXTENDED, 0)
     time.sleep(waitTime)
 
 
@@ -1002,7 +1093,7 @@ def PressKey(key: int, waitTime: float = OPERATION_WAIT_TIME) -> None:
     key: int, a value in class `Keys`.
     waitTime: float.
     """
-    keybd_event(key, 0, KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey, 0)
+    keybd_event(key, 0, KEY_DOWN_EXTENDED, 0)
     time.sleep(waitTime)
 
 
@@ -1012,7 +1103,7 @@ def ReleaseKey(key: int, waitTime: float = OPERATION_WAIT_TIME) -> None:
     key: int, a value in class `Keys`.
     waitTime: float.
     """
-    keybd_event(key, 0, KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey, 0)
+    keybd_event(key, 0, KEY_UP_EXTENDED, 0)
     time.sleep(waitTime)
 
 
@@ -1076,6 +1167,31 @@ def SendInput(*inputs) -> int:
     # return ctypes.windll.user32.SendInput(nInputs, ctypes.byref(pInputs), cbSize)
 
 
+@functools.lru_cache(maxsize=256)
+def _VkKeyScan(char: str, keyboardLayout: int) -> int:
+    # keyboardLayout is only part of the cache key, VkKeyScanW uses the current layout of the calling thread
+    return ctypes.windll.user32.VkKeyScanW(ctypes.wintypes.WCHAR(char))
+
+
+def VkKeyScan(char: str) -> int:
+    """
+    VkKeyScanW from Win32, cached per char and keyboard layout.
+    char: str, len(char) must equal to 1.
+    Return int, the virtual key code in the low byte and the shift state in the high byte, -1 if no key translates to char.
+    """
+    return _VkKeyScan(char, ctypes.windll.user32.GetKeyboardLayout(0))
+
+
+@functools.lru_cache(maxsize=256)
+def _KeyboardInputPair(vk: int, scan: int, flag: int) -> ctypes.Array:
+    """
+    Return a cached `INPUT * 2` array, the key down and key up input of a key, for `SendUnicodeChar`.
+    SendInput only reads the array, so the same one is passed every time the key is typed.
+    """
+    return (INPUT * 2)(KeyboardInput(vk, scan, flag | KeyboardEventFlag.KeyDown),
+                       KeyboardInput(vk, scan, flag | KeyboardEventFlag.KeyUp))
+
+
 def SendUnicodeChar(char: str, charMode: bool = True) -> int:
     """
     Type a single unicode char.
@@ -1089,7 +1205,7 @@ def SendUnicodeChar(char: str, charMode: bool = True) -> int:
         scan = ord(char)
         flag = KeyboardEventFlag.KeyUnicode
     else:
-        res = ctypes.windll.user32.VkKeyScanW(ctypes.wintypes.WCHAR(char))
+        res = VkKeyScan(char)
         if (res >> 8) & 0xFF == 0:
             vk = res & 0xFF
             scan = 0
@@ -1098,8 +1214,7 @@ def SendUnicodeChar(char: str, charMode: bool = True) -> int:
             vk = 0
             scan = ord(char)
             flag = KeyboardEventFlag.KeyUnicode
-    return SendInput(KeyboardInput(vk, scan, flag | KeyboardEventFlag.KeyDown),
-                     KeyboardInput(vk, scan, flag | KeyboardEventFlag.KeyUp))
+    return ctypes.windll.user32.SendInput(2, _KeyboardInputPair(vk, scan, flag), ctypes.sizeof(INPUT))
 
 
 _SCKeys = {
@@ -1147,6 +1262,11 @@ def _VKtoSC(key: int) -> int:
     return scanCode
 
 
+# names of the modifier keys that SendKeys holds down until the following key or group is sent
+_SendKeysHoldKeys = frozenset(('WIN', 'LWIN', 'RWIN', 'SHIFT', 'LSHIFT', 'RSHIFT', 'CTRL', 'CONTROL', 'LCTRL', 'RCTRL',
+                               'LCONTROL', 'RCONTROL', 'ALT', 'LALT', 'RALT'))
+
+
 def SendKeys(text: str, interval: float = 0.01, waitTime: float = OPERATION_WAIT_TIME, charMode: bool = True, debug: bool = False) -> None:
     """
     Simulate typing keys on keyboard.
@@ -1168,7 +1288,7 @@ def SendKeys(text: str, interval: float = 0.01, waitTime: float = OPERATION_WAIT
     SendKeys('`~!@#$%^&*()-_=+{Enter}')
     SendKeys('[]{{}{}}\\|;:\'\",<.>/?{Enter}')
     """
-    holdKeys = ('WIN', 'LWIN', 'RWIN', 'SHIFT', 'LSHIFT', 'RSHIFT', 'CTRL', 'CONTROL', 'LCTRL', 'RCTRL', 'LCONTROL', 'LCONTROL', 'ALT', 'LALT', 'RALT')
+    holdKeys = _SendKeysHoldKeys
     keys = []
     printKeys = []
     i = 0
@@ -1198,21 +1318,21 @@ def SendKeys(text: str, interval: float = 0.01, waitTime: float = OPERATION_WAIT
                 if hold:
                     if upperKey in SpecialKeyNames:
                         keyValue = SpecialKeyNames[upperKey]
-                        if type(lastKeyValue) == type(keyValue) and lastKeyValue == keyValue:
+                        if lastKeyValue == keyValue:
                             insertIndex += 1
                         printKeys.insert(insertIndex, (key[0], 'KeyDown | ExtendedKey'))
                         printKeys.insert(insertIndex + 1, (key[0], 'KeyUp | ExtendedKey'))
-                        keys.insert(insertIndex, (keyValue, KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey))
-                        keys.insert(insertIndex + 1, (keyValue, KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey))
+                        keys.insert(insertIndex, (keyValue, KEY_DOWN_EXTENDED))
+                        keys.insert(insertIndex + 1, (keyValue, KEY_UP_EXTENDED))
                         lastKeyValue = keyValue
                     elif key[0] in CharacterCodes:
                         keyValue = CharacterCodes[key[0]]
-                        if type(lastKeyValue) == type(keyValue) and lastKeyValue == keyValue:
+                        if lastKeyValue == keyValue:
                             insertIndex += 1
                         printKeys.insert(insertIndex, (key[0], 'KeyDown | ExtendedKey'))
                         printKeys.insert(insertIndex + 1, (key[0], 'KeyUp | ExtendedKey'))
-                        keys.insert(insertIndex, (keyValue, KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey))
-                        keys.insert(insertIndex + 1, (keyValue, KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey))
+                        keys.insert(insertIndex, (keyValue, KEY_DOWN_EXTENDED))
+                        keys.insert(insertIndex + 1, (keyValue, KEY_UP_EXTENDED))
                         lastKeyValue = keyValue
                     else:
                         printKeys.insert(insertIndex, (key[0], 'UnicodeChar'))
@@ -1230,8 +1350,8 @@ def SendKeys(text: str, interval: float = 0.01, waitTime: float = OPERATION_WAIT
                         keyValue = SpecialKeyNames[upperKey]
                         printKeys.append((key[0], 'KeyDown | ExtendedKey'))
                         printKeys.append((key[0], 'KeyUp | ExtendedKey'))
-                        keys.append((keyValue, KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey))
-                        keys.append((keyValue, KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey))
+                        keys.append((keyValue, KEY_DOWN_EXTENDED))
+                        keys.append((keyValue, KEY_UP_EXTENDED))
                         lastKeyValue = keyValue
                         if upperKey in holdKeys:
                             hold = True
@@ -1262,14 +1382,14 @@ def SendKeys(text: str, interval: float = 0.01, waitTime: float = OPERATION_WAIT
             i += 1
         else:
             if hold:
-                if text[i] in CharacterCodes:
-                    keyValue = CharacterCodes[text[i]]
-                    if include and type(lastKeyValue) == type(keyValue) and lastKeyValue == keyValue:
+                keyValue = CharToVK(text[i])
+                if keyValue:
+                    if include and lastKeyValue == keyValue:
                         insertIndex += 1
                     printKeys.insert(insertIndex, (text[i], 'KeyDown | ExtendedKey'))
                     printKeys.insert(insertIndex + 1, (text[i], 'KeyUp | ExtendedKey'))
-                    keys.insert(insertIndex, (keyValue, KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey))
-                    keys.insert(insertIndex + 1, (keyValue, KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey))
+                    keys.insert(insertIndex, (keyValue, KEY_DOWN_EXTENDED))
+                    keys.insert(insertIndex + 1, (keyValue, KEY_UP_EXTENDED))
                     lastKeyValue = keyValue
                 else:
                     printKeys.append((text[i], 'UnicodeChar'))
@@ -1303,8 +1423,8 @@ def SendKeys(text: str, interval: float = 0.01, waitTime: float = OPERATION_WAIT
                 if debug:
                     Logger.Write(', sleep({})\n'.format(interval), writeToFile=False)
             else:
-                if key[1] & KeyboardEventFlag.KeyUp:
-                    if keys[i + 1][1] == 'UnicodeChar' or keys[i + 1][1] & KeyboardEventFlag.KeyUp == 0:
+                if key[1] & KEY_UP:
+                    if keys[i + 1][1] == 'UnicodeChar' or keys[i + 1][1] & KEY_UP == 0:
                         time.sleep(interval)
                         if debug:
                             Logger.Write(', sleep({})\n'.format(interval), writeToFile=False)
@@ -1789,11 +1909,31 @@ class RawFormat:
     Icon = 10
 
 
+def _PixelArrayFromColors(colors: Sequence[int], count: int) -> ctypes.Array:
+    """
+    Convert colors to a `ctypes.c_uint32 * count` array.
+    A contiguous buffer object of count*4 bytes is wrapped without copying(or copied once if it is read-only),
+    other sequences are converted element by element.
+    """
+    arrayType = ctypes.c_uint32 * count
+    try:
+        view = memoryview(colors)
+    except TypeError:
+        return arrayType(*colors)
+    if view.c_contiguous and view.nbytes == count * 4:
+        view = view.cast('B')
+        if view.readonly:
+            return arrayType.from_buffer_copy(view)
+        return arrayType.from_buffer(view)
+    return arrayType(*colors)
+
+
 class Bitmap:
     """
     A simple Bitmap class wraps Windows GDI+ Gdiplus::Bitmap, but may not have high efficiency.
     The color format is Gdiplus::PixelFormat32bppARGB 0xAARRGGBB, byte order is B G R A.
     """
+    __slots__ = ('_width', '_height', '_bitmap', '_format', '_formatStr')
 
     def __init__(self, width: int = 0, height: int = 0):
         """
@@ -1820,14 +1960,14 @@ class Bitmap:
         return self._bitmap > 0
 
     def _GetSize(self) -> None:
-        size = _DllClient.instance().dll.BitmapGetWidthAndHeight(ctypes.c_size_t(self._bitmap))
+        size = _BitmapDll().BitmapGetWidthAndHeight(ctypes.c_size_t(self._bitmap))
         self._width = size & 0xFFFFFFFF
         self._height = size >> 32
 
     def Close(self) -> None:
         """Close the underlying Gdiplus::Bitmap object."""
         if self._bitmap:
-            _DllClient.instance().dll.BitmapRelease(ctypes.c_size_t(self._bitmap))
+            _BitmapDll().BitmapRelease(ctypes.c_size_t(self._bitmap))
             self._bitmap = 0
             self._width = 0
             self._height = 0
@@ -2180,7 +2320,7 @@ class Bitmap:
         r = (argb & 0x00FF_0000) >> 16
         a = (argb & 0xFF00_0000) >> 24
         """
-        return _DllClient.instance().dll.BitmapGetPixel(ctypes.c_size_t(self._bitmap), x, y)
+        return _BitmapDll().BitmapGetPixel(ctypes.c_size_t(self._bitmap), x, y)
 
     def SetPixelColor(self, x: int, y: int, argb: int) -> bool:
         """
@@ -2190,7 +2330,7 @@ class Bitmap:
         argb: int, ARGB(0xAARRGGBB) color format.
         Return bool, True if succeed otherwise False.
         """
-        gdiStatus = _DllClient.instance().dll.BitmapSetPixel(ctypes.c_size_t(self._bitmap), x, y, argb)
+        gdiStatus = _BitmapDll().BitmapSetPixel(ctypes.c_size_t(self._bitmap), x, y, argb)
         return gdiStatus == 0
 
     def GetPixelColorsHorizontally(self, x: int, y: int, count: int) -> ctypes.Array:
@@ -2203,7 +2343,7 @@ class Bitmap:
         #assert count <= self.Width * (self.Height - y) - x, 'count > max available from x,y'
         arrayType = ctypes.c_uint32 * count
         values = arrayType()
-        gdiStatus = _DllClient.instance().dll.BitmapGetPixelsHorizontally(ctypes.c_size_t(self._bitmap), x, y, values, count)
+        gdiStatus = _BitmapDll().BitmapGetPixelsHorizontally(ctypes.c_size_t(self._bitmap), x, y, values, count)
         return values
 
     def SetPixelColorsHorizontally(self, x: int, y: int, colors: Sequence[int]) -> bool:
@@ -2220,7 +2360,7 @@ class Bitmap:
         if not isinstance(colors, ctypes.Array):
             arrayType = ctypes.c_uint32 * count
             colors = arrayType(*colors)
-        gdiStatus = _DllClient.instance().dll.BitmapSetPixelsHorizontally(ctypes.c_size_t(self._bitmap), x, y, colors, count)
+        gdiStatus = _BitmapDll().BitmapSetPixelsHorizontally(ctypes.c_size_t(self._bitmap), x, y, colors, count)
         return gdiStatus == 0
 
     def GetPixelColorsVertically(self, x: int, y: int, count: int) -> ctypes.Array:
@@ -2233,7 +2373,7 @@ class Bitmap:
         #assert count <= self.Height * (self.Width - x) - y, 'count > max available from x,y'
         arrayType = ctypes.c_uint32 * count
         values = arrayType()
-        gdiStatus = _DllClient.instance().dll.BitmapGetPixelsVertically(ctypes.c_size_t(self._bitmap), x, y, values, count)
+        gdiStatus = _BitmapDll().BitmapGetPixelsVertically(ctypes.c_size_t(self._bitmap), x, y, values, count)
         return values
 
     def SetPixelColorsVertically(self, x: int, y: int, colors: Sequence[int]) -> bool:
@@ -2250,7 +2390,7 @@ class Bitmap:
         if not isinstance(colors, ctypes.Array):
             arrayType = ctypes.c_uint32 * count
             colors = arrayType(*colors)
-        gdiStatus = _DllClient.instance().dll.BitmapSetPixelsVertically(ctypes.c_size_t(self._bitmap), x, y, colors, count)
+        gdiStatus = _BitmapDll().BitmapSetPixelsVertically(ctypes.c_size_t(self._bitmap), x, y, colors, count)
         return gdiStatus == 0
 
     def GetPixelColorsOfRow(self, y: int) -> ctypes.Array:
@@ -2277,7 +2417,7 @@ class Bitmap:
         """
         arrayType = ctypes.c_uint32 * (width * height)
         values = arrayType()
-        gdiStatus = _DllClient.instance().dll.BitmapGetPixelsOfRect(ctypes.c_size_t(self._bitmap), x, y, width, height, values)
+        gdiStatus = _BitmapDll().BitmapGetPixelsOfRect(ctypes.c_size_t(self._bitmap), x, y, width, height, values)
         return values
 
     def SetPixelColorsOfRect(self, x: int, y: int, width: int, height: int, colors: Sequence[int]) -> bool:
@@ -2288,13 +2428,13 @@ class Bitmap:
         height: int.
         colors: Sequence[int], a sequence of int values in ARGB(0xAARRGGBB) color format, it's length must equal to width*height,
             use ctypes.Array for better performance, such as `ctypes.c_uint32 * (width*height)`.
+            A contiguous buffer of width*height*4 bytes(bytearray, array.array('I'), numpy.ndarray(dtype=uint32)...) is passed without per pixel conversion.
         Return bool.
         """
         #assert len(colors) == width * height, 'len(colors) != width * height'
         if not isinstance(colors, ctypes.Array):
-            arrayType = ctypes.c_uint32 * (width * height)
-            colors = arrayType(*colors)
-        gdiStatus = _DllClient.instance().dll.BitmapSetPixelsOfRect(ctypes.c_size_t(self._bitmap), x, y, width, height, colors)
+            colors = _PixelArrayFromColors(colors, width * height)
+        gdiStatus = _BitmapDll().BitmapSetPixelsOfRect(ctypes.c_size_t(self._bitmap), x, y, width, height, colors)
         return gdiStatus == 0
 
     def GetPixelColorsOfRects(self, rects: List[Tuple[int, int, int, int]]) -> List[ctypes.Array]:
@@ -2337,13 +2477,31 @@ class Bitmap:
         nativeArray = arrayType(*[color]*(width * height))
         return self.SetPixelColorsOfRect(x, y, width, height, nativeArray)
 
+    def EqualsRect(self, bitmap: 'Bitmap', x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> bool:
+        """
+        Compare the pixels of rect(x,y,width,height) in self and bitmap, such as checking whether the UI changed between two captures.
+        bitmap: `Bitmap`.
+        x: int.
+        y: int.
+        width: int, if == 0, the width will be self.Width-x
+        height: int, if == 0, the height will be self.Height-y
+        Return bool, True if all pixels in the rect are the same.
+        The pixels are copied out and compared with memoryview.
+        """
+        if width == 0:
+            width = self.Width - x
+        if height == 0:
+            height = self.Height - y
+        return memoryview(self.GetPixelColorsOfRect(x, y, width, height)).cast('B') \
+            == memoryview(bitmap.GetPixelColorsOfRect(x, y, width, height)).cast('B')
+
     def Clone(self) -> 'MemoryBMP':
         """
         Return `Bitmap`'s subclass instance.
         The cloned Bitmap's RawFormat is same as original Bitmap.
         If Bitmap is multiple frames, the cloned Bitmap is also multiple frames.
         """
-        cbmp = _DllClient.instance().dll.BitmapClone(ctypes.c_size_t(self._bitmap), 0, 0, self._width, self._height)
+        cbmp = _BitmapDll().BitmapClone(ctypes.c_size_t(self._bitmap), 0, 0, self._width, self._height)
         return Bitmap._FromGdiplusBitmap(cbmp)
 
     def Copy(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> 'MemoryBMP':
@@ -2359,11 +2517,12 @@ class Bitmap:
             width = self.Width - x
         if height == 0:
             height = self.Height - y
-        nativeArray = self.GetPixelColorsOfRect(x, y, width, height)
         bitmap = MemoryBMP(width, height)
-        bitmap.SetPixelColorsOfRect(0, 0, width, height, nativeArray)
+        left, top, right, bottom = max(0, x), max(0, y), min(self._width, x + width), min(self._height, y + height)
+        if right > left and bottom > top:
+            bitmap._CopyRectFrom(left - x, top - y, self, left, top, right - left, bottom - top)
         return bitmap
-        # cbmp = _DllClient.instance().dll.BitmapClone(ctypes.c_size_t(self._bitmap), x, y, width, height)
+        # cbmp = _BitmapDll().BitmapClone(ctypes.c_size_t(self._bitmap), x, y, width, height)
         # return Bitmap._FromGdiplusBitmap(cbmp)
 
     def Paste(self, x: int, y: int, bitmap: 'Bitmap') -> bool:
@@ -2382,8 +2541,7 @@ class Bitmap:
             return False
         srcX = 0 if x >= 0 else -x
         srcY = 0 if y >= 0 else -y
-        nativeArray = bitmap.GetPixelColorsOfRect(srcX, srcY, width, height)
-        return self.SetPixelColorsOfRect(left, top, width, height, nativeArray)
+        return self._CopyRectFrom(left, top, bitmap, srcX, srcY, width, height)
 
     def PastePart(self, dstX: int, dstY: int, srcBitmap: 'Bitmap', srcX: int = 0, srcY: int = 0, srcWidth: int = 0, srcHeight: int = 0) -> bool:
         """
@@ -2406,6 +2564,14 @@ class Bitmap:
         width, height = right - left, bottom - top
         if width <= 0 or height <= 0:
             return False
+        return self._CopyRectFrom(dstX, dstY, srcBitmap, srcX, srcY, width, height)
+
+    def _CopyRectFrom(self, dstX: int, dstY: int, srcBitmap: 'Bitmap', srcX: int, srcY: int, width: int, height: int) -> bool:
+        """
+        Copy rect(srcX, srcY, width, height) of srcBitmap to (dstX, dstY) of self, the rect must be already clipped.
+        Pixels go through a Python-held ctypes.Array.
+        Return bool, True if succeed otherwise False.
+        """
         nativeArray = srcBitmap.GetPixelColorsOfRect(srcX, srcY, width, height)
         return self.SetPixelColorsOfRect(dstX, dstY, width, height, nativeArray)
 
@@ -2460,6 +2626,8 @@ class Bitmap:
 
 
 class MultiFrameBitmap(Bitmap):
+    __slots__ = ('_frameCount', '_index')
+
     def __init__(self, width: int = 0, height: int = 0):
         super().__init__(width, height)
         self._frameCount = 0
@@ -2493,38 +2661,40 @@ class MultiFrameBitmap(Bitmap):
 
 
 class MemoryBMP(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class BMP(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class JPEG(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class PNG(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class EMF(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class WMF(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class ICON(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class EXIF(Bitmap):
-    pass
+    __slots__ = ()
 
 
 class TIFF(MultiFrameBitmap):
+    __slots__ = ()
+
     @staticmethod
     def ToTiffFile(path: str, bitmaps: List['Bitmap']) -> bool:
         '''
@@ -2532,15 +2702,15 @@ class TIFF(MultiFrameBitmap):
         path: str, file path.
         bitmaps: List[Bitmap].
         '''
-        cbitmaps = (ctypes.c_size_t * len(bitmaps))()
-        for i, bmp in enumerate(bitmaps):
-            cbitmaps[i] = bmp._bitmap
+        cbitmaps = (ctypes.c_size_t * len(bitmaps))(*[bmp._bitmap for bmp in bitmaps])
         gdiStatus = _DllClient.instance().dll.MultiBitmapToFile(cbitmaps, None, len(bitmaps),
                                                                 ctypes.c_wchar_p(path), "image/tiff")
         return gdiStatus == 0
 
 
 class GIF(MultiFrameBitmap):
+    __slots__ = ('_frameDelay',)
+
     def __init__(self, width: int = 0, height: int = 0):
         super().__init__(width, height)
         self._frameDelay = ()
@@ -2554,7 +2724,8 @@ class GIF(MultiFrameBitmap):
             if gdiStatus == 0:
                 valueOffset = valueOffset.value
                 # the uint of frame delay is 1/100 second
-                self._frameDelay = tuple(10*int.from_bytes(delayData[i:i+4], byteorder='little') for i in range(valueOffset, valueOffset+4*self._frameCount, 4))
+                delays = struct.unpack_from('<{}I'.format(self._frameCount), delayData, valueOffset)
+                self._frameDelay = tuple(10 * delay for delay in delays)
 
     def GetFrameDelay(self, index: int) -> int:
         '''
@@ -2579,11 +2750,9 @@ class GIF(MultiFrameBitmap):
         '''
         assert len(bitmaps) == len(delays)
         blen = len(bitmaps)
-        cbitmaps = (ctypes.c_size_t * blen)()
-        cdelays = (ctypes.c_uint32 * blen)()
-        for i, bmp in enumerate(bitmaps):
-            cbitmaps[i] = bmp._bitmap
-            cdelays[i] = delays[i] // 10
+        cbitmaps = (ctypes.c_size_t * blen)(*[bmp._bitmap for bmp in bitmaps])
+        # the uint of gif frame delay is 1/100 second
+        cdelays = (ctypes.c_uint32 * blen)(*[delay // 10 for delay in delays])
         gdiStatus = _DllClient.instance().dll.SaveGif(cbitmaps, cdelays, blen, ctypes.c_wchar_p(path))
         return gdiStatus == 0
 
@@ -2593,11 +2762,14 @@ _ClipboardLock = threading.Lock()
 
 def _OpenClipboard(value):
     end = ProcessTime() + 0.2
+    attempt = 0
     while ProcessTime() < end:
-        ret = ctypes.windll.user32.OpenClipboard(value)
+        ret = _user32.OpenClipboard(value)
         if ret:
             return ret
-        time.sleep(0.005)
+        # back off exponentially(1, 2, 4, 8, 16 ms...), a clipboard held briefly is retried almost at once
+        time.sleep(0.001 * (1 << min(attempt, 4)))
+        attempt += 1
 
 
 def GetClipboardFormats() -> Dict[int, str]:
@@ -2610,30 +2782,30 @@ def GetClipboardFormats() -> Dict[int, str]:
     with _ClipboardLock:
         if _OpenClipboard(0):
             formatType = 0
-            arrayType = ctypes.c_wchar * 64
+            values = (ctypes.c_wchar * 64)()
             while True:
-                formatType = ctypes.windll.user32.EnumClipboardFormats(formatType)
+                formatType = _user32.EnumClipboardFormats(formatType)
                 if formatType == 0:
                     break
-                values = arrayType()
-                ctypes.windll.user32.GetClipboardFormatNameW(formatType, values, len(values))
+                values[0] = '\0'  # reuse the buffer, GetClipboardFormatNameW writes nothing for predefined formats
+                _user32.GetClipboardFormatNameW(formatType, values, len(values))
                 formatName = values.value
                 if not formatName:
                     formatName = _GetDictKeyName(ClipboardFormat.__dict__, formatType, lambda key: key.startswith('CF_'))
                 formats[formatType] = formatName
-            ctypes.windll.user32.CloseClipboard()
+            _user32.CloseClipboard()
     return formats
 
 
 def GetClipboardText() -> str:
     with _ClipboardLock:
         if _OpenClipboard(0):
-            if ctypes.windll.user32.IsClipboardFormatAvailable(ClipboardFormat.CF_UNICODETEXT):
-                hClipboardData = ctypes.windll.user32.GetClipboardData(ClipboardFormat.CF_UNICODETEXT)
-                hText = ctypes.windll.kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
+            if _user32.IsClipboardFormatAvailable(ClipboardFormat.CF_UNICODETEXT):
+                hClipboardData = _user32.GetClipboardData(ClipboardFormat.CF_UNICODETEXT)
+                hText = _kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
                 text = ctypes.c_wchar_p(hText).value
-                ctypes.windll.kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
-                ctypes.windll.user32.CloseClipboard()
+                _kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
+                _user32.CloseClipboard()
                 if text is None:
                     return ''
                 return text
@@ -2644,22 +2816,25 @@ def SetClipboardText(text: str) -> bool:
     """
     Return bool, True if succeed otherwise False.
     """
+    # the length of the utf-16 bytes is known, copy them with memmove instead of scanning for the terminator,
+    # encode before opening the clipboard so an encoding error can not leave it open and emptied
+    textBytes = text.encode('utf-16-le', 'surrogatepass') + b'\0\0'
+    textByteLen = len(textBytes)
     ret = False
     with _ClipboardLock:
         if _OpenClipboard(0):
-            ctypes.windll.user32.EmptyClipboard()
-            textByteLen = (len(text) + 1) * 2
-            hClipboardData = ctypes.windll.kernel32.GlobalAlloc(0x2, textByteLen)  # GMEM_MOVEABLE
-            hDestText = ctypes.windll.kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
-            ctypes.cdll.msvcrt.wcsncpy(ctypes.c_wchar_p(hDestText), ctypes.c_wchar_p(text), ctypes.c_size_t(textByteLen // 2))
-            ctypes.windll.kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
+            _user32.EmptyClipboard()
+            hClipboardData = _kernel32.GlobalAlloc(0x2, textByteLen)  # GMEM_MOVEABLE
+            hDestText = _kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
+            ctypes.memmove(hDestText, textBytes, textByteLen)
+            _kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
             # system owns hClipboardData after calling SetClipboardData,
             # application can not write to or free the data once ownership has been transferred to the system
-            if ctypes.windll.user32.SetClipboardData(ctypes.c_uint(ClipboardFormat.CF_UNICODETEXT), ctypes.c_void_p(hClipboardData)):
+            if _user32.SetClipboardData(ctypes.c_uint(ClipboardFormat.CF_UNICODETEXT), ctypes.c_void_p(hClipboardData)):
                 ret = True
             else:
-                ctypes.windll.kernel32.GlobalFree(ctypes.c_void_p(hClipboardData))
-            ctypes.windll.user32.CloseClipboard()
+                _kernel32.GlobalFree(ctypes.c_void_p(hClipboardData))
+            _user32.CloseClipboard()
     return ret
 
 
@@ -2672,18 +2847,26 @@ def GetClipboardHtml() -> str:
     """
     with _ClipboardLock:
         if _OpenClipboard(0):
-            if ctypes.windll.user32.IsClipboardFormatAvailable(ClipboardFormat.CF_HTML):
-                hClipboardData = ctypes.windll.user32.GetClipboardData(ClipboardFormat.CF_HTML)
-                hText = ctypes.windll.kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
+            if _user32.IsClipboardFormatAvailable(ClipboardFormat.CF_HTML):
+                hClipboardData = _user32.GetClipboardData(ClipboardFormat.CF_HTML)
+                hText = _kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
                 v = ctypes.c_char_p(hText).value
-                ctypes.windll.kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
-                ctypes.windll.user32.CloseClipboard()
+                _kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
+                _user32.CloseClipboard()
                 if v is None:
                     return ''
                 return v.decode('utf-8')
     return ''
 
 
+# CF_HTML layout, the header has a fixed length because every position is formatted with 8 digits
+_HtmlClipboardHeader = b'Version:0.9\r\nStartHTML:%08d\r\nEndHTML:%08d\r\nStartFragment:%08d\r\nEndFragment:%08d\r\n'
+_HtmlClipboardPrefix = b'<html>\r\n<body>\r\n<!--StartFragment-->'
+_HtmlClipboardSuffix = b'<!--EndFragment-->\r\n</body>\r\n</html>'
+_HtmlClipboardHeaderLen = len(_HtmlClipboardHeader % (0, 0, 0, 0))
+_HtmlClipboardStartFragment = _HtmlClipboardHeaderLen + len(_HtmlClipboardPrefix)
+
+
 def SetClipboardHtml(htmlText: str) -> bool:
     """
     htmlText: str, such as '<h1>Title</h1><h3>Hello</h3><p>hello world</p>'
@@ -2691,46 +2874,64 @@ def SetClipboardHtml(htmlText: str) -> bool:
     Refer: https://docs.microsoft.com/en-us/troubleshoot/cpp/add-html-code-clipboard
     """
     u8Html = htmlText.encode('utf-8')
-    formatBytes = b'Version:0.9\r\nStartHTML:00000000\r\nEndHTML:00000000\r\nStartFragment:00000000\r\nEndFragment:00000000\r\n<html>\r\n<body>\r\n<!--StartFragment-->{}<!--EndFragment-->\r\n</body>\r\n</html>'
-    startHtml = formatBytes.find(b'<html>')
-    endHtml = len(formatBytes) + len(u8Html) - 2
-    startFragment = formatBytes.find(b'{}')
-    endFragment = formatBytes.find(b'<!--EndFragment-->') + len(u8Html) - 2
-    formatBytes = formatBytes.replace(b'StartHTML:00000000', 'StartHTML:{:08}'.format(startHtml).encode('utf-8'))
-    formatBytes = formatBytes.replace(b'EndHTML:00000000', 'EndHTML:{:08}'.format(endHtml).encode('utf-8'))
-    formatBytes = formatBytes.replace(b'StartFragment:00000000', 'StartFragment:{:08}'.format(startFragment).encode('utf-8'))
-    formatBytes = formatBytes.replace(b'EndFragment:00000000', 'EndFragment:{:08}'.format(endFragment).encode('utf-8'))
-    u8Result = formatBytes.replace(b'{}', u8Html)
+    endFragment = _HtmlClipboardStartFragment + len(u8Html)
+    endHtml = endFragment + len(_HtmlClipboardSuffix)
+    header = _HtmlClipboardHeader % (_HtmlClipboardHeaderLen, endHtml, _HtmlClipboardStartFragment, endFragment)
+    u8Result = b''.join((header, _HtmlClipboardPrefix, u8Html, _HtmlClipboardSuffix))
     ret = False
     with _ClipboardLock:
         if _OpenClipboard(0):
-            ctypes.windll.user32.EmptyClipboard()
-            hClipboardData = ctypes.windll.kernel32.GlobalAlloc(0x2002, len(u8Result) + 4)  # GMEM_MOVEABLE |GMEM_DDESHARE
-            hDestText = ctypes.windll.kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
-            ctypes.cdll.msvcrt.strncpy(ctypes.c_char_p(hDestText), ctypes.c_char_p(u8Result), len(u8Result))
-            ctypes.windll.kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
+            _user32.EmptyClipboard()
+            hClipboardData = _kernel32.GlobalAlloc(0x2002, len(u8Result) + 4)  # GMEM_MOVEABLE |GMEM_DDESHARE
+            hDestText = _kernel32.GlobalLock(ctypes.c_void_p(hClipboardData))
+            ctypes.memmove(hDestText, u8Result, len(u8Result))
+            ctypes.memset(hDestText + len(u8Result), 0, 4)
+            _kernel32.GlobalUnlock(ctypes.c_void_p(hClipboardData))
             # system owns hClipboardData after calling SetClipboardData,
             # application can not write to or free the data once ownership has been transferred to the system
-            if ctypes.windll.user32.SetClipboardData(ctypes.c_uint(ClipboardFormat.CF_HTML), ctypes.c_void_p(hClipboardData)):
+            if _user32.SetClipboardData(ctypes.c_uint(ClipboardFormat.CF_HTML), ctypes.c_void_p(hClipboardData)):
                 ret = True
             else:
-                ctypes.windll.kernel32.GlobalFree(ctypes.c_void_p(hClipboardData))
-            ctypes.windll.user32.CloseClipboard()
+                _kernel32.GlobalFree(ctypes.c_void_p(hClipboardData))
+            _user32.CloseClipboard()
     return ret
 
 
 def GetClipboardBitmap() -> Optional[Bitmap]:
     with _ClipboardLock:
         if _OpenClipboard(0):
-            if ctypes.windll.user32.IsClipboardFormatAvailable(ClipboardFormat.CF_BITMAP):
-                hClipboardData = ctypes.windll.user32.GetClipboardData(ClipboardFormat.CF_BITMAP)
-                cbmp = _DllClient.instance().dll.BitmapFromHBITMAP(ctypes.c_size_t(hClipboardData), 0, 0, 0, 0)
+            if _user32.IsClipboardFormatAvailable(ClipboardFormat.CF_BITMAP):
+                hClipboardData = _user32.GetClipboardData(ClipboardFormat.CF_BITMAP)
+                cbmp = _DllClient.instance().dll.BitmapFromHBITMAP(hClipboardData, 0, 0, 0, 0)
                 bitmap = Bitmap._FromGdiplusBitmap(cbmp)
-                ctypes.windll.user32.CloseClipboard()
+                _user32.CloseClipboard()
                 return bitmap
     return None
 
 
+def _CreateClipboardHBITMAP(bitmap: Bitmap) -> int:
+    """
+    Return a new device dependent HBITMAP with the content of bitmap, for CF_BITMAP.
+    """
+    user32, gdi32 = _user32, _gdi32
+    # handles are plain ints here, argtypes of these functions are declared on the private dll instances
+    hBitmap = _DllClient.instance().dll.BitmapToHBITMAP(bitmap._bitmap, 0xFFFFFFFF)
+    hBitmap2 = gdi32.CreateBitmap(bitmap.Width, bitmap.Height, 1, 32, None)
+    hdc = user32.GetDC(None)
+    hdc1 = gdi32.CreateCompatibleDC(hdc)
+    hdc2 = gdi32.CreateCompatibleDC(hdc)
+    user32.ReleaseDC(None, hdc)
+    hOldBmp1 = gdi32.SelectObject(hdc1, hBitmap)
+    hOldBmp2 = gdi32.SelectObject(hdc2, hBitmap2)
+    gdi32.BitBlt(hdc2, 0, 0, bitmap.Width, bitmap.Height, hdc1, 0, 0, 0x00CC0020)  # SRCCOPY
+    gdi32.SelectObject(hdc1, hOldBmp1)
+    gdi32.SelectObject(hdc2, hOldBmp2)
+    gdi32.DeleteDC(hdc1)
+    gdi32.DeleteDC(hdc2)
+    gdi32.DeleteObject(hBitmap)
+    return hBitmap2
+
+
 def SetClipboardBitmap(bitmap: Bitmap) -> bool:
     """
     Return bool, True if succeed otherwise False.
@@ -2738,28 +2939,15 @@ def SetClipboardBitmap(bitmap: Bitmap) -> bool:
     ret = False
     with _ClipboardLock:
         if bitmap._bitmap and _OpenClipboard(0):
-            ctypes.windll.user32.EmptyClipboard()
-            hBitmap = _DllClient.instance().dll.BitmapToHBITMAP(ctypes.c_size_t(bitmap._bitmap), 0xFFFFFFFF)
-            hBitmap2 = ctypes.windll.gdi32.CreateBitmap(bitmap.Width, bitmap.Height, 1, 32, 0)
-            hdc = ctypes.windll.user32.GetDC(0)
-            hdc1 = ctypes.windll.gdi32.CreateCompatibleDC(ctypes.c_void_p(hdc))
-            hdc2 = ctypes.windll.gdi32.CreateCompatibleDC(ctypes.c_void_p(hdc))
-            ctypes.windll.user32.ReleaseDC(0, ctypes.c_void_p(hdc))
-            hOldBmp1 = ctypes.windll.gdi32.SelectObject(ctypes.c_void_p(hdc1), ctypes.c_void_p(hBitmap))
-            hOldBmp2 = ctypes.windll.gdi32.SelectObject(ctypes.c_void_p(hdc2), ctypes.c_void_p(hBitmap2))
-            ctypes.windll.gdi32.BitBlt(ctypes.c_void_p(hdc2), 0, 0, bitmap.Width, bitmap.Height, ctypes.c_void_p(hdc1), 0, 0, 0x00CC0020)  # SRCCOPY
-            ctypes.windll.gdi32.SelectObject(ctypes.c_void_p(hdc1), ctypes.c_void_p(hOldBmp1))
-            ctypes.windll.gdi32.SelectObject(ctypes.c_void_p(hdc2), ctypes.c_void_p(hOldBmp2))
-            ctypes.windll.gdi32.DeleteDC(ctypes.c_void_p(hdc1))
-            ctypes.windll.gdi32.DeleteDC(ctypes.c_void_p(hdc2))
-            ctypes.windll.gdi32.DeleteObject(ctypes.c_void_p(hBitmap))
+            _user32.EmptyClipboard()
+            hBitmap2 = _CreateClipboardHBITMAP(bitmap)
             # system owns hClipboardData after calling SetClipboardData,
             # application can not write to or free the data once ownership has been transferred to the system
-            if ctypes.windll.user32.SetClipboardData(ctypes.c_uint(ClipboardFormat.CF_BITMAP), ctypes.c_void_p(hBitmap2)):
+            if _user32.SetClipboardData(ClipboardFormat.CF_BITMAP, hBitmap2):
                 ret = True
             else:
-                ctypes.windll.gdi32.DeleteObject(ctypes.c_void_p(hBitmap2))
-            ctypes.windll.user32.CloseClipboard()
+                _gdi32.DeleteObject(hBitmap2)
+            _user32.CloseClipboard()
     return ret
 
 
@@ -2775,6 +2963,7 @@ class Rect():
     """
     class Rect, like `ctypes.wintypes.RECT`.
     """
+    __slots__ = ('left', 'top', 'right', 'bottom')
 
     def __init__(self, left: int = 0, top: int = 0, right: int = 0, bottom: int = 0):
         self.left = left
@@ -2788,21 +2977,27 @@ class Rect():
     def height(self) -> int:
         return self.bottom - self.top
 
+    # the methods below read each coordinate once and do the arithmetic inline instead of calling width()/height(),
+    # they are called for every node when walking a control tree
+
     def xcenter(self) -> int:
-        return self.left + self.width() // 2
+        left = self.left
+        return left + (self.right - left) // 2
 
     def ycenter(self) -> int:
-        return self.top + self.height() // 2
+        top = self.top
+        return top + (self.bottom - top) // 2
 
     def isempty(self) -> int:
-        return self.width() == 0 or self.height() == 0
+        return self.right == self.left or self.bottom == self.top
 
     def contains(self, x: int, y: int) -> bool:
         return self.left <= x < self.right and self.top <= y < self.bottom
 
     def intersect(self, rect: 'Rect') -> 'Rect':
-        left, top, right, bottom = max(self.left, rect.left), max(self.top, rect.top), min(self.right, rect.right), min(self.bottom, rect.bottom)
-        return Rect(left, top, right, bottom)
+        sl, st, sr, sb = self.left, self.top, self.right, self.bottom
+        rl, rt, rr, rb = rect.left, rect.top, rect.right, rect.bottom
+        return Rect(sl if sl > rl else rl, st if st > rt else rt, sr if sr < rr else rr, sb if sb < rb else rb)
 
     def offset(self, x: int, y: int) -> None:
         self.left += x
@@ -2811,7 +3006,9 @@ class Rect():
         self.bottom += y
 
     def __eq__(self, rect):
-        return self.left == rect.left and self.top == rect.top and self.right == rect.right and self.bottom == rect.bottom
+        if self is rect:
+            return True
+        return (self.left, self.top, self.right, self.bottom) == (rect.left, rect.top, rect.right, rect.bottom)
 
     def __str__(self) -> str:
         return '({},{},{},{})[{}x{}]'.format(self.left, self.top, self.right, self.bottom, self.width(), self.height())
@@ -2820,28 +3017,6 @@ class Rect():
         return '{}({},{},{},{})[{}x{}]'.format(self.__class__.__name__, self.left, self.top, self.right, self.bottom, self.width(), self.height())
 
 
-class ClipboardFormat:
-    CF_TEXT = 1
-    CF_BITMAP = 2
-    CF_METAFILEPICT = 3
-    CF_SYLK = 4
-    CF_DIF = 5
-    CF_TIFF = 6
-    CF_OEMTEXT = 7
-    CF_DIB = 8
-    CF_PALETTE = 9
-    CF_PENDATA = 10
-    CF_RIFF = 11
-    CF_WAVE = 12
-    CF_UNICODETEXT = 13
-    CF_ENHMETAFILE = 14
-    CF_HDROP = 15
-    CF_LOCALE = 16
-    CF_DIBV5 = 17
-    CF_MAX = 18
-    CF_HTML = ctypes.windll.user32.RegisterClipboardFormatW("HTML Format")
-
-
 # TODO: Failed to parse structure ACCESSTIMEOUT
 class ExtendedProperty(ctypes.Structure):
     _fields_ = [
@@ -3012,73 +3187,34 @@ class UiaWindowClosedEventArgs(ctypes.Structure):
         ('cRuntimeIdLen', ctypes.c_int),
     ]
 
-class ExtendedProperty(ctypes.Structure):
-    _fields_ = [
-        ('PropertyName', ctypes.c_wchar_p),
-        ('PropertyValue', ctypes.c_wchar_p),
-    ]
-
-class UIAutomationEventInfo(ctypes.Structure):
-    _fields_ = [
-        ('guid', ctypes.c_void_p),
-        ('pProgrammaticName', ctypes.wintypes.LPCWSTR),
-    ]
-
-class UIAutomationMethodInfo(ctypes.Structure):
-    _fields_ = [
-        ('pProgrammaticName', ctypes.wintypes.LPCWSTR),
-        ('doSetFocus', ctypes.wintypes.BOOL),
-        ('cInParameters', ctypes.wintypes.UINT),
-        ('cOutParameters', ctypes.wintypes.UINT),
-        ('pParameterTypes', ctypes.c_void_p),
-        ('pParameterNames', ctypes.c_void_p),
-    ]
 
-class UIAutomationParameter(ctypes.Structure):
-    _fields_ = [
-        ('type', ctypes.c_void_p),
-        ('pData', ctypes.c_void_p),
-    ]
+_IUIAutomation = None
 
-class UIAutomationPatternInfo(ctypes.Structure):
-    _fields_ = [
-        ('guid', ctypes.c_void_p),
-        ('pProgrammaticName', ctypes.wintypes.LPCWSTR),
-        ('providerInterfaceId', ctypes.c_void_p),
-        ('clientInterfaceId', ctypes.c_void_p),
-        ('cProperties', ctypes.wintypes.UINT),
-        ('UIAutomationPropertyInfo', ctypes.c_void_p),
-        ('cMethods', ctypes.wintypes.UINT),
-        ('UIAutomationMethodInfo', ctypes.c_void_p),
-        ('cEvents', ctypes.wintypes.UINT),
-        ('UIAutomationEventInfo', ctypes.c_void_p),
-        ('pPatternHandler', ctypes.c_void_p),
-    ]
 
-class UIAutomationPropertyInfo(ctypes.Structure):
-    _fields_ = [
-        ('guid', ctypes.c_void_p),
-        ('pProgrammaticName', ctypes.wintypes.LPCWSTR),
-        ('type', ctypes.c_void_p),
-    ]
+def _GetIUIAutomation():
+    """
+    Return `_AutomationClient.instance().IUIAutomation`, it is looked up at the first call and kept in a module variable.
+    """
+    global _IUIAutomation
+    if _IUIAutomation is None:
+        _IUIAutomation = _AutomationClient.instance().IUIAutomation
+    return _IUIAutomation
 
-class UiaAndOrCondition(ctypes.Structure):
-    _fields_ = [
-        ('ConditionType', ctypes.c_void_p),
-        ('ppConditions', ctypes.c_void_p),
-        ('UiaCondition', ctypes.c_void_p),
-        ('cConditions', ctypes.c_int),
-    ]
 
 class CacheRequest:
     """
     Wrapper for IUIAutomationCacheRequest.
     """
+    __slots__ = ('check_request', '_propertyIds', '_patternIds')
+
     def __init__(self, cache_request=None):
         if cache_request:
             self.check_request = cache_request
         else:
-            self.check_request = _AutomationClient.instance().IUIAutomation.CreateCacheRequest()
+            self.check_request = _GetIUIAutomation().CreateCacheRequest()
+        # ids already added through this wrapper, adding one again is skipped
+        self._propertyIds = set()
+        self._patternIds = set()
 
     @property
     def TreeScope(self) -> int:
@@ -3109,21 +3245,62 @@ class CacheRequest:
         Adds a property to the cache request.
         propertyId: int, PropertyId.
         """
+        if propertyId in self._propertyIds:
+            return
         self.check_request.AddProperty(propertyId)
+        self._propertyIds.add(propertyId)
 
     def AddPattern(self, patternId: int):
         """
         Adds a pattern to the cache request.
         patternId: int, PatternId.
         """
+        if patternId in self._patternIds:
+            return
         self.check_request.AddPattern(patternId)
+        self._patternIds.add(patternId)
+
+    def Configure(self, scope: Optional[int] = None, mode: Optional[int] = None, filter=None,
+                  properties: Iterable[int] = (), patterns: Iterable[int] = ()) -> None:
+        """
+        Set up the cache request in one call, prefer this to the TreeScope, AutomationElementMode and TreeFilter setters
+        and repeated AddProperty/AddPattern calls when configuring many ids.
+        scope: int, a value in class `TreeScope`, None to keep the current value.
+        mode: int, a value in class `AutomationElementMode`, None to keep the current value.
+        filter: a condition, None to keep the current value.
+        properties: Iterable[int], values in class `PropertyId`.
+        patterns: Iterable[int], values in class `PatternId`.
+        """
+        request = self.check_request
+        if scope is not None:
+            request.TreeScope = scope
+        if mode is not None:
+            request.AutomationElementMode = mode
+        if filter is not None:
+            request.TreeFilter = filter
+        addProperty = request.AddProperty
+        propertyIds = self._propertyIds
+        for propertyId in properties:
+            if propertyId not in propertyIds:
+                addProperty(propertyId)
+                propertyIds.add(propertyId)
+        addPattern = request.AddPattern
+        patternIds = self._patternIds
+        for patternId in patterns:
+            if patternId not in patternIds:
+                addPattern(patternId)
+                patternIds.add(patternId)
 
     def Clone(self) -> 'CacheRequest':
         """
         Clones the cache request.
         """
-        cloned = self.check_request.Clone()
-        return CacheRequest(cloned)
+        # bypass __init__, the cloned COM object is all the new wrapper needs
+        cloned = CacheRequest.__new__(CacheRequest)
+        cloned.check_request = self.check_request.Clone()
+        cloned._propertyIds = set(self._propertyIds)
+        cloned._patternIds = set(self._patternIds)
+        return cloned
 
 def CreateCacheRequest() -> CacheRequest:
     """
@@ -3133,70 +3310,81 @@ def CreateCacheRequest() -> CacheRequest:
 
 # Event Handling Implementations for core.py
 
+@functools.lru_cache(maxsize=64)
+def _PropertyIdArray(propertyIds: Tuple[int, ...]) -> ctypes.Array:
+    """
+    Return a `ctypes.c_int` array of propertyIds, cached so registering the same ids again reuses it.
+    """
+    return (ctypes.c_int * len(propertyIds))(*propertyIds)
+
+
 def AddAutomationEventHandler(eventId: int, element, scope: int, cacheRequest, handler) -> None:
     """
     Registers a method that handles Microsoft UI Automation events.
     """
-    _AutomationClient.instance().IUIAutomation.AddAutomationEventHandler(eventId, element, scope, cacheRequest, handler)
+    _GetIUIAutomation().AddAutomationEventHandler(eventId, element, scope, cacheRequest, handler)
 
 def RemoveAutomationEventHandler(eventId: int, element, handler) -> None:
     """
     Removes the specified Microsoft UI Automation event handler.
     """
-    _AutomationClient.instance().IUIAutomation.RemoveAutomationEventHandler(eventId, element, handler)
+    _GetIUIAutomation().RemoveAutomationEventHandler(eventId, element, handler)
 
 def AddPropertyChangedEventHandler(element, scope: int, cacheRequest, handler, propertyArray: List[int]) -> None:
     """
     Registers a method that handles UI Automation property-changed events.
+    propertyArray: List[int] or Tuple[int, ...], values in class `PropertyId`, nothing is registered if it is empty.
     """
-    # Convert propertyArray to a ctypes array if needed, but comtypes usually handles lists
-    # However, AddPropertyChangedEventHandler expects a pointer to an array of property IDs
-    # Let's see how generic we can be.
-    # The signature in IUIAutomation is: HRESULT AddPropertyChangedEventHandler(ptr_element, scope, ptr_cacheRequest, ptr_handler, ptr_propertyArray)
-    # The last arg is SAFEARRAY(int)
-    
-    # We might need to manually convert list to SAFEARRAY or rely on comtypes.
-    # For now, let's pass a tuple/list and see if comtypes marshals it.
-    _AutomationClient.instance().IUIAutomation.AddPropertyChangedEventHandler(element, scope, cacheRequest, handler, propertyArray)
+    if not propertyArray:
+        return
+    # IUIAutomation::AddPropertyChangedEventHandlerNativeArray takes a plain int array and its length,
+    # pass a prebuilt one so comtypes does not build a SAFEARRAY element by element on every call.
+    propertyIds = _PropertyIdArray(tuple(propertyArray))
+    _GetIUIAutomation().AddPropertyChangedEventHandlerNativeArray(element, scope, cacheRequest, handler, propertyIds, len(propertyIds))
 
 def RemovePropertyChangedEventHandler(element, handler) -> None:
     """
     Removes the specified property-changed event handler.
     """
-    _AutomationClient.instance().IUIAutomation.RemovePropertyChangedEventHandler(element, handler)
+    _GetIUIAutomation().RemovePropertyChangedEventHandler(element, handler)
 
 def AddStructureChangedEventHandler(element, scope: int, cacheRequest, handler) -> None:
     """
     Registers a method that handles UI Automation structure-changed events.
     """
-    _AutomationClient.instance().IUIAutomation.AddStructureChangedEventHandler(element, scope, cacheRequest, handler)
+    _GetIUIAutomation().AddStructureChangedEventHandler(element, scope, cacheRequest, handler)
 
 def RemoveStructureChangedEventHandler(element, handler) -> None:
     """
     Removes the specified structure-changed event handler.
     """
-    _AutomationClient.instance().IUIAutomation.RemoveStructureChangedEventHandler(element, handler)
+    _GetIUIAutomation().RemoveStructureChangedEventHandler(element, handler)
 
 def AddFocusChangedEventHandler(cacheRequest, handler) -> None:
     """
     Registers a method that handles UI Automation focus-changed events.
     """
-    _AutomationClient.instance().IUIAutomation.AddFocusChangedEventHandler(cacheRequest, handler)
+    _GetIUIAutomation().AddFocusChangedEventHandler(cacheRequest, handler)
 
 def RemoveFocusChangedEventHandler(handler) -> None:
     """
     Removes the specified focus-changed event handler.
     """
-    _AutomationClient.instance().IUIAutomation.RemoveFocusChangedEventHandler(handler)
+    _GetIUIAutomation().RemoveFocusChangedEventHandler(handler)
 
 def RemoveAllEventHandlers() -> None:
     """
     Removes all registered Microsoft UI Automation event handlers.
     """
-    _AutomationClient.instance().IUIAutomation.RemoveAllEventHandlers()
+    _GetIUIAutomation().RemoveAllEventHandlers()
 
 
 # Condition creation helper functions
+# The true and false conditions are created once and shared, the others are created through COM on every call.
+
+_TrueCondition = None
+_FalseCondition = None
+
 
 def CreateTrueCondition():
     """
@@ -3205,7 +3393,10 @@ def CreateTrueCondition():
     Return: A condition object that can be used with FindAll, FindFirst, etc.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createtruecondition
     """
-    return _AutomationClient.instance().IUIAutomation.CreateTrueCondition()
+    global _TrueCondition
+    if _TrueCondition is None:
+        _TrueCondition = _GetIUIAutomation().CreateTrueCondition()
+    return _TrueCondition
 
 
 def CreateFalseCondition():
@@ -3215,7 +3406,10 @@ def CreateFalseCondition():
     Return: A condition object that can be used with FindAll, FindFirst, etc.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createfalsecondition
     """
-    return _AutomationClient.instance().IUIAutomation.CreateFalseCondition()
+    global _FalseCondition
+    if _FalseCondition is None:
+        _FalseCondition = _GetIUIAutomation().CreateFalseCondition()
+    return _FalseCondition
 
 
 def CreatePropertyCondition(propertyId: int, value):
@@ -3228,7 +3422,7 @@ def CreatePropertyCondition(propertyId: int, value):
     
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createpropertycondition
     """
-    return _AutomationClient.instance().IUIAutomation.CreatePropertyCondition(propertyId, value)
+    return _GetIUIAutomation().CreatePropertyCondition(propertyId, value)
 
 
 def CreateAndCondition(condition1, condition2):
@@ -3241,7 +3435,30 @@ def CreateAndCondition(condition1, condition2):
     
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createandcondition
     """
-    return _AutomationClient.instance().IUIAutomation.CreateAndCondition(condition1, condition2)
+    # conditions from CreateTrueCondition/CreateFalseCondition are singletons, fold them without COM,
+    # the singletons are None until first created, so None arguments must not be folded, COM rejects them
+    if condition1 is not None and condition2 is not None:
+        if condition1 is _TrueCondition:
+            return condition2
+        if condition2 is _TrueCondition:
+            return condition1
+        if condition1 is _FalseCondition or condition2 is _FalseCondition:
+            return _FalseCondition
+    return _GetIUIAutomation().CreateAndCondition(condition1, condition2)
+
+
+def CreateAndConditionFromArray(conditions: Sequence):
+    """
+    Create a condition that is the logical AND of all conditions, in one COM call instead of chaining `CreateAndCondition`.
+
+    conditions: Sequence of conditions.
+    Return: A condition object that can be used with FindAll, FindFirst, etc.
+
+    Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createandconditionfromarray
+    """
+    if len(conditions) == 1:
+        return conditions[0]
+    return _GetIUIAutomation().CreateAndConditionFromArray(list(conditions))
 
 
 def CreateOrCondition(condition1, condition2):
@@ -3254,7 +3471,28 @@ def CreateOrCondition(condition1, condition2):
     
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createorcondition
     """
-    return _AutomationClient.instance().IUIAutomation.CreateOrCondition(condition1, condition2)
+    if condition1 is not None and condition2 is not None:
+        if condition1 is _FalseCondition:
+            return condition2
+        if condition2 is _FalseCondition:
+            return condition1
+        if condition1 is _TrueCondition or condition2 is _TrueCondition:
+            return _TrueCondition
+    return _GetIUIAutomation().CreateOrCondition(condition1, condition2)
+
+
+def CreateOrConditionFromArray(conditions: Sequence):
+    """
+    Create a condition that is the logical OR of all conditions, in one COM call instead of chaining `CreateOrCondition`.
+
+    conditions: Sequence of conditions.
+    Return: A condition object that can be used with FindAll, FindFirst, etc.
+
+    Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createorconditionfromarray
+    """
+    if len(conditions) == 1:
+        return conditions[0]
+    return _GetIUIAutomation().CreateOrConditionFromArray(list(conditions))
 
 
 def CreateNotCondition(condition):
@@ -3266,4 +3504,9 @@ def CreateNotCondition(condition):
     
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomation-createnotcondition
     """
-    return _AutomationClient.instance().IUIAutomation.CreateNotCondition(condition)
+    if condition is not None:
+        if condition is _TrueCondition:
+            return CreateFalseCondition()
+        if condition is _FalseCondition:
+            return CreateTrueCondition()
+    return _GetIUIAutomation().CreateNotCondition(condition)
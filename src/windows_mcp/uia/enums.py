@@ -11,21 +11,13 @@ uiautomation is shared under the Apache Licene 2.0.
 This means that the code can be freely copied and distributed, and costs nothing to use.
 """
 
-import os
 import sys
 import time
-import datetime
-import re
-import shlex
-import struct
-import atexit
-import threading
 import ctypes
 import ctypes.wintypes
-import comtypes
 from enum import IntEnum, IntFlag
-from io import TextIOWrapper
-from typing import (Any, Callable, Dict, Generator, List, Tuple, Optional, Union, Sequence)
+from types import MappingProxyType
+from typing import Any, Final, Mapping
 
 
 METRO_WINDOW_CLASS_NAME = 'Windows.UI.Core.CoreWindow'  # for Windows 8 and 8.1
@@ -33,19 +25,18 @@ SEARCH_INTERVAL = 0.5  # search control interval seconds
 MAX_MOVE_SECOND = 1  # simulate mouse move or drag max seconds
 TIME_OUT_SECOND = 10
 OPERATION_WAIT_TIME = 0.5
-MAX_PATH = 260
+MAX_PATH: Final[int] = 260
 DEBUG_SEARCH_TIME = False
 DEBUG_EXIST_DISAPPEAR = False
-S_OK = 0
+S_OK: Final[int] = 0
 
 IsPy38OrHigher = sys.version_info[:2] >= (3, 8)
-IsNT6orHigher = os.sys.getwindowsversion().major >= 6
-CurrentProcessIs64Bit = sys.maxsize > 0xFFFFFFFF
-ProcessTime = time.perf_counter  # this returns nearly 0 when first call it if python version <= 3.6
-ProcessTime()  # need to call it once if python version <= 3.6
-TreeNode = Any
+IsNT6orHigher = sys.getwindowsversion().major >= 6
+CurrentProcessIs64Bit = sys.maxsize.bit_length() > 32
+ProcessTime = time.perf_counter
 
-class ControlType:
+
+class ControlType(IntEnum):
     """
     ControlType from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/winauto/uiauto-controltype-ids
@@ -93,52 +84,10 @@ class ControlType:
     WindowControl = 50032
 
 
-ControlTypeNames = {
-    ControlType.AppBarControl: 'AppBarControl',
-    ControlType.ButtonControl: 'ButtonControl',
-    ControlType.CalendarControl: 'CalendarControl',
-    ControlType.CheckBoxControl: 'CheckBoxControl',
-    ControlType.ComboBoxControl: 'ComboBoxControl',
-    ControlType.CustomControl: 'CustomControl',
-    ControlType.DataGridControl: 'DataGridControl',
-    ControlType.DataItemControl: 'DataItemControl',
-    ControlType.DocumentControl: 'DocumentControl',
-    ControlType.EditControl: 'EditControl',
-    ControlType.GroupControl: 'GroupControl',
-    ControlType.HeaderControl: 'HeaderControl',
-    ControlType.HeaderItemControl: 'HeaderItemControl',
-    ControlType.HyperlinkControl: 'HyperlinkControl',
-    ControlType.ImageControl: 'ImageControl',
-    ControlType.ListControl: 'ListControl',
-    ControlType.ListItemControl: 'ListItemControl',
-    ControlType.MenuBarControl: 'MenuBarControl',
-    ControlType.MenuControl: 'MenuControl',
-    ControlType.MenuItemControl: 'MenuItemControl',
-    ControlType.PaneControl: 'PaneControl',
-    ControlType.ProgressBarControl: 'ProgressBarControl',
-    ControlType.RadioButtonControl: 'RadioButtonControl',
-    ControlType.ScrollBarControl: 'ScrollBarControl',
-    ControlType.SemanticZoomControl: 'SemanticZoomControl',
-    ControlType.SeparatorControl: 'SeparatorControl',
-    ControlType.SliderControl: 'SliderControl',
-    ControlType.SpinnerControl: 'SpinnerControl',
-    ControlType.SplitButtonControl: 'SplitButtonControl',
-    ControlType.StatusBarControl: 'StatusBarControl',
-    ControlType.TabControl: 'TabControl',
-    ControlType.TabItemControl: 'TabItemControl',
-    ControlType.TableControl: 'TableControl',
-    ControlType.TextControl: 'TextControl',
-    ControlType.ThumbControl: 'ThumbControl',
-    ControlType.TitleBarControl: 'TitleBarControl',
-    ControlType.ToolBarControl: 'ToolBarControl',
-    ControlType.ToolTipControl: 'ToolTipControl',
-    ControlType.TreeControl: 'TreeControl',
-    ControlType.TreeItemControl: 'TreeItemControl',
-    ControlType.WindowControl: 'WindowControl',
-}
-
-
-class PatternId:
+ControlTypeNames = MappingProxyType({m.value: m.name for m in ControlType})
+
+
+class PatternId(IntEnum):
     """
     PatternId from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/winauto/uiauto-controlpattern-ids
@@ -180,46 +129,10 @@ class PatternId:
     SelectionPattern2 = 10034
 
 
-PatternIdNames = {
-    PatternId.AnnotationPattern: 'AnnotationPattern',
-    PatternId.CustomNavigationPattern: 'CustomNavigationPattern',
-    PatternId.DockPattern: 'DockPattern',
-    PatternId.DragPattern: 'DragPattern',
-    PatternId.DropTargetPattern: 'DropTargetPattern',
-    PatternId.ExpandCollapsePattern: 'ExpandCollapsePattern',
-    PatternId.GridItemPattern: 'GridItemPattern',
-    PatternId.GridPattern: 'GridPattern',
-    PatternId.InvokePattern: 'InvokePattern',
-    PatternId.ItemContainerPattern: 'ItemContainerPattern',
-    PatternId.LegacyIAccessiblePattern: 'LegacyIAccessiblePattern',
-    PatternId.MultipleViewPattern: 'MultipleViewPattern',
-    PatternId.ObjectModelPattern: 'ObjectModelPattern',
-    PatternId.RangeValuePattern: 'RangeValuePattern',
-    PatternId.ScrollItemPattern: 'ScrollItemPattern',
-    PatternId.ScrollPattern: 'ScrollPattern',
-    PatternId.SelectionItemPattern: 'SelectionItemPattern',
-    PatternId.SelectionPattern: 'SelectionPattern',
-    PatternId.SpreadsheetItemPattern: 'SpreadsheetItemPattern',
-    PatternId.SpreadsheetPattern: 'SpreadsheetPattern',
-    PatternId.StylesPattern: 'StylesPattern',
-    PatternId.SynchronizedInputPattern: 'SynchronizedInputPattern',
-    PatternId.TableItemPattern: 'TableItemPattern',
-    PatternId.TablePattern: 'TablePattern',
-    PatternId.TextChildPattern: 'TextChildPattern',
-    PatternId.TextEditPattern: 'TextEditPattern',
-    PatternId.TextPattern: 'TextPattern',
-    PatternId.TextPattern2: 'TextPattern2',
-    PatternId.TogglePattern: 'TogglePattern',
-    PatternId.TransformPattern: 'TransformPattern',
-    PatternId.TransformPattern2: 'TransformPattern2',
-    PatternId.ValuePattern: 'ValuePattern',
-    PatternId.VirtualizedItemPattern: 'VirtualizedItemPattern',
-    PatternId.WindowPattern: 'WindowPattern',
-    PatternId.SelectionPattern2: 'SelectionPattern2',
-}
-
-
-class PropertyId:
+PatternIdNames = MappingProxyType({m.value: m.name for m in PatternId})
+
+
+class PropertyId(IntEnum):
     """
     PropertyId from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/winauto/uiauto-automation-element-propids
@@ -400,184 +313,10 @@ class PropertyId:
     WindowWindowVisualStateProperty = 30075
 
 
-PropertyIdNames = {
-    PropertyId.AcceleratorKeyProperty: 'AcceleratorKeyProperty',
-    PropertyId.AccessKeyProperty: 'AccessKeyProperty',
-    PropertyId.AnnotationAnnotationTypeIdProperty: 'AnnotationAnnotationTypeIdProperty',
-    PropertyId.AnnotationAnnotationTypeNameProperty: 'AnnotationAnnotationTypeNameProperty',
-    PropertyId.AnnotationAuthorProperty: 'AnnotationAuthorProperty',
-    PropertyId.AnnotationDateTimeProperty: 'AnnotationDateTimeProperty',
-    PropertyId.AnnotationObjectsProperty: 'AnnotationObjectsProperty',
-    PropertyId.AnnotationTargetProperty: 'AnnotationTargetProperty',
-    PropertyId.AnnotationTypesProperty: 'AnnotationTypesProperty',
-    PropertyId.AriaPropertiesProperty: 'AriaPropertiesProperty',
-    PropertyId.AriaRoleProperty: 'AriaRoleProperty',
-    PropertyId.AutomationIdProperty: 'AutomationIdProperty',
-    PropertyId.BoundingRectangleProperty: 'BoundingRectangleProperty',
-    PropertyId.CenterPointProperty: 'CenterPointProperty',
-    PropertyId.ClassNameProperty: 'ClassNameProperty',
-    PropertyId.ClickablePointProperty: 'ClickablePointProperty',
-    PropertyId.ControlTypeProperty: 'ControlTypeProperty',
-    PropertyId.ControllerForProperty: 'ControllerForProperty',
-    PropertyId.CultureProperty: 'CultureProperty',
-    PropertyId.DescribedByProperty: 'DescribedByProperty',
-    PropertyId.DockDockPositionProperty: 'DockDockPositionProperty',
-    PropertyId.DragDropEffectProperty: 'DragDropEffectProperty',
-    PropertyId.DragDropEffectsProperty: 'DragDropEffectsProperty',
-    PropertyId.DragGrabbedItemsProperty: 'DragGrabbedItemsProperty',
-    PropertyId.DragIsGrabbedProperty: 'DragIsGrabbedProperty',
-    PropertyId.DropTargetDropTargetEffectProperty: 'DropTargetDropTargetEffectProperty',
-    PropertyId.DropTargetDropTargetEffectsProperty: 'DropTargetDropTargetEffectsProperty',
-    PropertyId.ExpandCollapseExpandCollapseStateProperty: 'ExpandCollapseExpandCollapseStateProperty',
-    PropertyId.FillColorProperty: 'FillColorProperty',
-    PropertyId.FillTypeProperty: 'FillTypeProperty',
-    PropertyId.FlowsFromProperty: 'FlowsFromProperty',
-    PropertyId.FlowsToProperty: 'FlowsToProperty',
-    PropertyId.FrameworkIdProperty: 'FrameworkIdProperty',
-    PropertyId.FullDescriptionProperty: 'FullDescriptionProperty',
-    PropertyId.GridColumnCountProperty: 'GridColumnCountProperty',
-    PropertyId.GridItemColumnProperty: 'GridItemColumnProperty',
-    PropertyId.GridItemColumnSpanProperty: 'GridItemColumnSpanProperty',
-    PropertyId.GridItemContainingGridProperty: 'GridItemContainingGridProperty',
-    PropertyId.GridItemRowProperty: 'GridItemRowProperty',
-    PropertyId.GridItemRowSpanProperty: 'GridItemRowSpanProperty',
-    PropertyId.GridRowCountProperty: 'GridRowCountProperty',
-    PropertyId.HasKeyboardFocusProperty: 'HasKeyboardFocusProperty',
-    PropertyId.HelpTextProperty: 'HelpTextProperty',
-    PropertyId.IsAnnotationPatternAvailableProperty: 'IsAnnotationPatternAvailableProperty',
-    PropertyId.IsContentElementProperty: 'IsContentElementProperty',
-    PropertyId.IsControlElementProperty: 'IsControlElementProperty',
-    PropertyId.IsCustomNavigationPatternAvailableProperty: 'IsCustomNavigationPatternAvailableProperty',
-    PropertyId.IsDataValidForFormProperty: 'IsDataValidForFormProperty',
-    PropertyId.IsDockPatternAvailableProperty: 'IsDockPatternAvailableProperty',
-    PropertyId.IsDragPatternAvailableProperty: 'IsDragPatternAvailableProperty',
-    PropertyId.IsDropTargetPatternAvailableProperty: 'IsDropTargetPatternAvailableProperty',
-    PropertyId.IsEnabledProperty: 'IsEnabledProperty',
-    PropertyId.IsExpandCollapsePatternAvailableProperty: 'IsExpandCollapsePatternAvailableProperty',
-    PropertyId.IsGridItemPatternAvailableProperty: 'IsGridItemPatternAvailableProperty',
-    PropertyId.IsGridPatternAvailableProperty: 'IsGridPatternAvailableProperty',
-    PropertyId.IsInvokePatternAvailableProperty: 'IsInvokePatternAvailableProperty',
-    PropertyId.IsItemContainerPatternAvailableProperty: 'IsItemContainerPatternAvailableProperty',
-    PropertyId.IsKeyboardFocusableProperty: 'IsKeyboardFocusableProperty',
-    PropertyId.IsLegacyIAccessiblePatternAvailableProperty: 'IsLegacyIAccessiblePatternAvailableProperty',
-    PropertyId.IsMultipleViewPatternAvailableProperty: 'IsMultipleViewPatternAvailableProperty',
-    PropertyId.IsObjectModelPatternAvailableProperty: 'IsObjectModelPatternAvailableProperty',
-    PropertyId.IsOffscreenProperty: 'IsOffscreenProperty',
-    PropertyId.IsPasswordProperty: 'IsPasswordProperty',
-    PropertyId.IsPeripheralProperty: 'IsPeripheralProperty',
-    PropertyId.IsRangeValuePatternAvailableProperty: 'IsRangeValuePatternAvailableProperty',
-    PropertyId.IsRequiredForFormProperty: 'IsRequiredForFormProperty',
-    PropertyId.IsScrollItemPatternAvailableProperty: 'IsScrollItemPatternAvailableProperty',
-    PropertyId.IsScrollPatternAvailableProperty: 'IsScrollPatternAvailableProperty',
-    PropertyId.IsSelectionItemPatternAvailableProperty: 'IsSelectionItemPatternAvailableProperty',
-    PropertyId.IsSelectionPattern2AvailableProperty: 'IsSelectionPattern2AvailableProperty',
-    PropertyId.IsSelectionPatternAvailableProperty: 'IsSelectionPatternAvailableProperty',
-    PropertyId.IsSpreadsheetItemPatternAvailableProperty: 'IsSpreadsheetItemPatternAvailableProperty',
-    PropertyId.IsSpreadsheetPatternAvailableProperty: 'IsSpreadsheetPatternAvailableProperty',
-    PropertyId.IsStylesPatternAvailableProperty: 'IsStylesPatternAvailableProperty',
-    PropertyId.IsSynchronizedInputPatternAvailableProperty: 'IsSynchronizedInputPatternAvailableProperty',
-    PropertyId.IsTableItemPatternAvailableProperty: 'IsTableItemPatternAvailableProperty',
-    PropertyId.IsTablePatternAvailableProperty: 'IsTablePatternAvailableProperty',
-    PropertyId.IsTextChildPatternAvailableProperty: 'IsTextChildPatternAvailableProperty',
-    PropertyId.IsTextEditPatternAvailableProperty: 'IsTextEditPatternAvailableProperty',
-    PropertyId.IsTextPattern2AvailableProperty: 'IsTextPattern2AvailableProperty',
-    PropertyId.IsTextPatternAvailableProperty: 'IsTextPatternAvailableProperty',
-    PropertyId.IsTogglePatternAvailableProperty: 'IsTogglePatternAvailableProperty',
-    PropertyId.IsTransformPattern2AvailableProperty: 'IsTransformPattern2AvailableProperty',
-    PropertyId.IsTransformPatternAvailableProperty: 'IsTransformPatternAvailableProperty',
-    PropertyId.IsValuePatternAvailableProperty: 'IsValuePatternAvailableProperty',
-    PropertyId.IsVirtualizedItemPatternAvailableProperty: 'IsVirtualizedItemPatternAvailableProperty',
-    PropertyId.IsWindowPatternAvailableProperty: 'IsWindowPatternAvailableProperty',
-    PropertyId.ItemStatusProperty: 'ItemStatusProperty',
-    PropertyId.ItemTypeProperty: 'ItemTypeProperty',
-    PropertyId.LabeledByProperty: 'LabeledByProperty',
-    PropertyId.LandmarkTypeProperty: 'LandmarkTypeProperty',
-    PropertyId.LegacyIAccessibleChildIdProperty: 'LegacyIAccessibleChildIdProperty',
-    PropertyId.LegacyIAccessibleDefaultActionProperty: 'LegacyIAccessibleDefaultActionProperty',
-    PropertyId.LegacyIAccessibleDescriptionProperty: 'LegacyIAccessibleDescriptionProperty',
-    PropertyId.LegacyIAccessibleHelpProperty: 'LegacyIAccessibleHelpProperty',
-    PropertyId.LegacyIAccessibleKeyboardShortcutProperty: 'LegacyIAccessibleKeyboardShortcutProperty',
-    PropertyId.LegacyIAccessibleNameProperty: 'LegacyIAccessibleNameProperty',
-    PropertyId.LegacyIAccessibleRoleProperty: 'LegacyIAccessibleRoleProperty',
-    PropertyId.LegacyIAccessibleSelectionProperty: 'LegacyIAccessibleSelectionProperty',
-    PropertyId.LegacyIAccessibleStateProperty: 'LegacyIAccessibleStateProperty',
-    PropertyId.LegacyIAccessibleValueProperty: 'LegacyIAccessibleValueProperty',
-    PropertyId.LevelProperty: 'LevelProperty',
-    PropertyId.LiveSettingProperty: 'LiveSettingProperty',
-    PropertyId.LocalizedControlTypeProperty: 'LocalizedControlTypeProperty',
-    PropertyId.LocalizedLandmarkTypeProperty: 'LocalizedLandmarkTypeProperty',
-    PropertyId.MultipleViewCurrentViewProperty: 'MultipleViewCurrentViewProperty',
-    PropertyId.MultipleViewSupportedViewsProperty: 'MultipleViewSupportedViewsProperty',
-    PropertyId.NameProperty: 'NameProperty',
-    PropertyId.NativeWindowHandleProperty: 'NativeWindowHandleProperty',
-    PropertyId.OptimizeForVisualContentProperty: 'OptimizeForVisualContentProperty',
-    PropertyId.OrientationProperty: 'OrientationProperty',
-    PropertyId.OutlineColorProperty: 'OutlineColorProperty',
-    PropertyId.OutlineThicknessProperty: 'OutlineThicknessProperty',
-    PropertyId.PositionInSetProperty: 'PositionInSetProperty',
-    PropertyId.ProcessIdProperty: 'ProcessIdProperty',
-    PropertyId.ProviderDescriptionProperty: 'ProviderDescriptionProperty',
-    PropertyId.RangeValueIsReadOnlyProperty: 'RangeValueIsReadOnlyProperty',
-    PropertyId.RangeValueLargeChangeProperty: 'RangeValueLargeChangeProperty',
-    PropertyId.RangeValueMaximumProperty: 'RangeValueMaximumProperty',
-    PropertyId.RangeValueMinimumProperty: 'RangeValueMinimumProperty',
-    PropertyId.RangeValueSmallChangeProperty: 'RangeValueSmallChangeProperty',
-    PropertyId.RangeValueValueProperty: 'RangeValueValueProperty',
-    PropertyId.RotationProperty: 'RotationProperty',
-    PropertyId.RuntimeIdProperty: 'RuntimeIdProperty',
-    PropertyId.ScrollHorizontalScrollPercentProperty: 'ScrollHorizontalScrollPercentProperty',
-    PropertyId.ScrollHorizontalViewSizeProperty: 'ScrollHorizontalViewSizeProperty',
-    PropertyId.ScrollHorizontallyScrollableProperty: 'ScrollHorizontallyScrollableProperty',
-    PropertyId.ScrollVerticalScrollPercentProperty: 'ScrollVerticalScrollPercentProperty',
-    PropertyId.ScrollVerticalViewSizeProperty: 'ScrollVerticalViewSizeProperty',
-    PropertyId.ScrollVerticallyScrollableProperty: 'ScrollVerticallyScrollableProperty',
-    PropertyId.Selection2CurrentSelectedItemProperty: 'Selection2CurrentSelectedItemProperty',
-    PropertyId.Selection2FirstSelectedItemProperty: 'Selection2FirstSelectedItemProperty',
-    PropertyId.Selection2ItemCountProperty: 'Selection2ItemCountProperty',
-    PropertyId.Selection2LastSelectedItemProperty: 'Selection2LastSelectedItemProperty',
-    PropertyId.SelectionCanSelectMultipleProperty: 'SelectionCanSelectMultipleProperty',
-    PropertyId.SelectionIsSelectionRequiredProperty: 'SelectionIsSelectionRequiredProperty',
-    PropertyId.SelectionItemIsSelectedProperty: 'SelectionItemIsSelectedProperty',
-    PropertyId.SelectionItemSelectionContainerProperty: 'SelectionItemSelectionContainerProperty',
-    PropertyId.SelectionSelectionProperty: 'SelectionSelectionProperty',
-    PropertyId.SizeOfSetProperty: 'SizeOfSetProperty',
-    PropertyId.SizeProperty: 'SizeProperty',
-    PropertyId.SpreadsheetItemAnnotationObjectsProperty: 'SpreadsheetItemAnnotationObjectsProperty',
-    PropertyId.SpreadsheetItemAnnotationTypesProperty: 'SpreadsheetItemAnnotationTypesProperty',
-    PropertyId.SpreadsheetItemFormulaProperty: 'SpreadsheetItemFormulaProperty',
-    PropertyId.StylesExtendedPropertiesProperty: 'StylesExtendedPropertiesProperty',
-    PropertyId.StylesFillColorProperty: 'StylesFillColorProperty',
-    PropertyId.StylesFillPatternColorProperty: 'StylesFillPatternColorProperty',
-    PropertyId.StylesFillPatternStyleProperty: 'StylesFillPatternStyleProperty',
-    PropertyId.StylesShapeProperty: 'StylesShapeProperty',
-    PropertyId.StylesStyleIdProperty: 'StylesStyleIdProperty',
-    PropertyId.StylesStyleNameProperty: 'StylesStyleNameProperty',
-    PropertyId.TableColumnHeadersProperty: 'TableColumnHeadersProperty',
-    PropertyId.TableItemColumnHeaderItemsProperty: 'TableItemColumnHeaderItemsProperty',
-    PropertyId.TableItemRowHeaderItemsProperty: 'TableItemRowHeaderItemsProperty',
-    PropertyId.TableRowHeadersProperty: 'TableRowHeadersProperty',
-    PropertyId.TableRowOrColumnMajorProperty: 'TableRowOrColumnMajorProperty',
-    PropertyId.ToggleToggleStateProperty: 'ToggleToggleStateProperty',
-    PropertyId.Transform2CanZoomProperty: 'Transform2CanZoomProperty',
-    PropertyId.Transform2ZoomLevelProperty: 'Transform2ZoomLevelProperty',
-    PropertyId.Transform2ZoomMaximumProperty: 'Transform2ZoomMaximumProperty',
-    PropertyId.Transform2ZoomMinimumProperty: 'Transform2ZoomMinimumProperty',
-    PropertyId.TransformCanMoveProperty: 'TransformCanMoveProperty',
-    PropertyId.TransformCanResizeProperty: 'TransformCanResizeProperty',
-    PropertyId.TransformCanRotateProperty: 'TransformCanRotateProperty',
-    PropertyId.ValueIsReadOnlyProperty: 'ValueIsReadOnlyProperty',
-    PropertyId.ValueValueProperty: 'ValueValueProperty',
-    PropertyId.VisualEffectsProperty: 'VisualEffectsProperty',
-    PropertyId.WindowCanMaximizeProperty: 'WindowCanMaximizeProperty',
-    PropertyId.WindowCanMinimizeProperty: 'WindowCanMinimizeProperty',
-    PropertyId.WindowIsModalProperty: 'WindowIsModalProperty',
-    PropertyId.WindowIsTopmostProperty: 'WindowIsTopmostProperty',
-    PropertyId.WindowWindowInteractionStateProperty: 'WindowWindowInteractionStateProperty',
-    PropertyId.WindowWindowVisualStateProperty: 'WindowWindowVisualStateProperty',
-}
-
-
-class AccessibleRole:
+PropertyIdNames = MappingProxyType({m.value: m.name for m in PropertyId})
+
+
+class AccessibleRole(IntEnum):
     """
     AccessibleRole from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/dotnet/api/system.windows.forms.accessiblerole?view=netframework-4.8
@@ -647,10 +386,10 @@ class AccessibleRole:
     IpAddress = 0x3f
     OutlineButton = 0x40
 
-AccessibleRoleNames = {v: k for k, v in AccessibleRole.__dict__.items() if not k.startswith('_')}
+AccessibleRoleNames = MappingProxyType({m.value: m.name for m in AccessibleRole})
 
 
-class AccessibleState():
+class AccessibleState(IntFlag):
     """
     AccessibleState from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/dotnet/api/system.windows.forms.accessiblestates?view=netframework-4.8
@@ -691,7 +430,7 @@ class AccessibleState():
     HasPopup = 0x40000000
 
 
-class AccessibleSelection:
+class AccessibleSelection(IntFlag):
     """
     AccessibleSelection from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/dotnet/api/system.windows.forms.accessibleselection?view=netframework-4.8
@@ -704,7 +443,7 @@ class AccessibleSelection:
     RemoveSelection = 0x10
 
 
-class AnnotationType:
+class AnnotationType(IntEnum):
     """
     AnnotationType from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/winauto/uiauto-annotation-type-identifiers
@@ -735,7 +474,7 @@ class AnnotationType:
     UnsyncedChange = 60015
 
 
-class NavigateDirection:
+class NavigateDirection(IntEnum):
     """
     NavigateDirection from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-navigatedirection
@@ -747,7 +486,7 @@ class NavigateDirection:
     LastChild = 4
 
 
-class DockPosition:
+class DockPosition(IntEnum):
     """
     DockPosition from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-dockposition
@@ -760,7 +499,7 @@ class DockPosition:
     None_ = 5
 
 
-class ScrollAmount:
+class ScrollAmount(IntEnum):
     """
     ScrollAmount from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-scrollamount
@@ -772,7 +511,7 @@ class ScrollAmount:
     SmallIncrement = 4
 
 
-class StyleId:
+class StyleId(IntEnum):
     """
     StyleId from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/winauto/uiauto-style-identifiers
@@ -796,7 +535,7 @@ class StyleId:
     NumberedList = 70016
 
 
-class RowOrColumnMajor:
+class RowOrColumnMajor(IntEnum):
     """
     RowOrColumnMajor from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-roworcolumnmajor
@@ -806,7 +545,7 @@ class RowOrColumnMajor:
     Indeterminate = 2
 
 
-class ExpandCollapseState:
+class ExpandCollapseState(IntEnum):
     """
     ExpandCollapseState from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-expandcollapsestate
@@ -817,7 +556,7 @@ class ExpandCollapseState:
     LeafNode = 3
 
 
-class OrientationType:
+class OrientationType(IntEnum):
     """
     OrientationType from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-orientationtype
@@ -827,7 +566,7 @@ class OrientationType:
     Vertical = 2
 
 
-class ToggleState:
+class ToggleState(IntEnum):
     """
     ToggleState from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-togglestate
@@ -837,7 +576,7 @@ class ToggleState:
     Indeterminate = 2
 
 
-class TextPatternRangeEndpoint:
+class TextPatternRangeEndpoint(IntEnum):
     """
     TextPatternRangeEndpoint from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-textpatternrangeendpoint
@@ -846,7 +585,7 @@ class TextPatternRangeEndpoint:
     End = 1
 
 
-class TextAttributeId:
+class TextAttributeId(IntEnum):
     """
     TextAttributeId from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/winauto/uiauto-textattribute-ids
@@ -897,7 +636,7 @@ class TextAttributeId:
     UnderlineStyleAttribute = 40030
 
 
-class TextUnit:
+class TextUnit(IntEnum):
     """
     TextUnit from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-textunit
@@ -911,7 +650,7 @@ class TextUnit:
     Document = 6
 
 
-class ZoomUnit:
+class ZoomUnit(IntEnum):
     """
     ZoomUnit from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-zoomunit
@@ -923,7 +662,7 @@ class ZoomUnit:
     SmallIncrement = 4
 
 
-class WindowInteractionState:
+class WindowInteractionState(IntEnum):
     """
     WindowInteractionState from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-windowinteractionstate
@@ -935,7 +674,7 @@ class WindowInteractionState:
     NotResponding = 4
 
 
-class WindowVisualState:
+class WindowVisualState(IntEnum):
     """
     WindowVisualState from IUIAutomation.
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationcore/ne-uiautomationcore-windowvisualstate
@@ -945,7 +684,7 @@ class WindowVisualState:
     Minimized = 2
 
 
-class ConsoleColor:
+class ConsoleColor(IntEnum):
     """ConsoleColor from Win32."""
     Default = -1
     Black = 0
@@ -966,14 +705,14 @@ class ConsoleColor:
     White = 15
 
 
-class GAFlag:
+class GAFlag(IntEnum):
     """GAFlag from Win32."""
     Parent = 1
     Root = 2
     RootOwner = 3
 
 
-class MouseEventFlag:
+class MouseEventFlag(IntFlag):
     """MouseEventFlag from Win32."""
     Move = 0x0001
     LeftDown = 0x0002
@@ -991,7 +730,7 @@ class MouseEventFlag:
     Absolute = 0x8000
 
 
-class KeyboardEventFlag:
+class KeyboardEventFlag(IntFlag):
     """KeyboardEventFlag from Win32."""
     KeyDown = 0x0000
     ExtendedKey = 0x0001
@@ -1000,14 +739,20 @@ class KeyboardEventFlag:
     KeyScanCode = 0x0008
 
 
-class InputType:
+# KeyboardEventFlag values as plain ints for SendKeys and PressKey/ReleaseKey, KeyboardEventFlag operands would run IntFlag.__or__/__and__ in Python
+KEY_DOWN_EXTENDED: Final[int] = int(KeyboardEventFlag.KeyDown | KeyboardEventFlag.ExtendedKey)
+KEY_UP_EXTENDED: Final[int] = int(KeyboardEventFlag.KeyUp | KeyboardEventFlag.ExtendedKey)
+KEY_UP: Final[int] = int(KeyboardEventFlag.KeyUp)
+
+
+class InputType(IntEnum):
     """InputType from Win32"""
     Mouse = 0
     Keyboard = 1
     Hardware = 2
 
 
-class ModifierKey:
+class ModifierKey(IntFlag):
     """ModifierKey from Win32."""
     Alt = 0x0001
     Control = 0x0002
@@ -1016,7 +761,7 @@ class ModifierKey:
     NoRepeat = 0x4000
 
 
-class SW:
+class SW(IntEnum):
     """ShowWindow params from Win32."""
     Hide = 0
     ShowNormal = 1
@@ -1035,12 +780,16 @@ class SW:
     Max = 11
 
 
-class SWP:
-    """SetWindowPos params from Win32."""
+class HWNDInsertAfter(IntEnum):
+    """SetWindowPos hWndInsertAfter values from Win32."""
     HWND_Top = 0
     HWND_Bottom = 1
     HWND_Topmost = -1
     HWND_NoTopmost = -2
+
+
+class SWP(IntFlag):
+    """SetWindowPos flags from Win32."""
     SWP_NoSize = 0x0001
     SWP_NoMove = 0x0002
     SWP_NoZOrder = 0x0004
@@ -1058,7 +807,7 @@ class SWP:
     SWP_AsyncWindowPos = 0x4000
 
 
-class MB:
+class MB(IntFlag):
     """MessageBox flags from Win32."""
     Ok = 0x00000000
     OkCancel = 0x00000001
@@ -1099,6 +848,9 @@ class MB:
     ModeMask = 0x00003000
     MiscMask = 0x0000c000
 
+
+class MBResult(IntEnum):
+    """MessageBox return values from Win32."""
     IdOk = 1
     IdCancel = 2
     IdAbort = 3
@@ -1113,7 +865,7 @@ class MB:
     IdTimeout = 32000
 
 
-class GWL:
+class GWL(IntEnum):
     ExStyle = -20
     HInstance = -6
     HwndParent = -8
@@ -1123,13 +875,13 @@ class GWL:
     WndProc = -4
 
 
-class ProcessDpiAwareness:
+class ProcessDpiAwareness(IntEnum):
     DpiUnaware = 0
     SystemDpiAware = 1
     PerMonitorDpiAware = 2
 
 
-class DpiAwarenessContext:
+class DpiAwarenessContext(IntEnum):
     Unaware = -1
     SystemAware = -2
     PerMonitorAware = -3
@@ -1137,7 +889,7 @@ class DpiAwarenessContext:
     UnawareGdiScaled = -5
 
 
-class Keys:
+class Keys(IntEnum):
     """Key codes from Win32."""
     VK_LBUTTON = 0x01                       #Left mouse button
     VK_RBUTTON = 0x02                       #Right mouse button
@@ -1317,159 +1069,163 @@ class Keys:
     VK_OEM_CLEAR = 0xFE                     #Clear key
 
 
-SpecialKeyNames = {
-    'LBUTTON': Keys.VK_LBUTTON,                        #Left mouse button
-    'RBUTTON': Keys.VK_RBUTTON,                        #Right mouse button
-    'CANCEL': Keys.VK_CANCEL,                          #Control-break processing
-    'MBUTTON': Keys.VK_MBUTTON,                        #Middle mouse button (three-button mouse)
-    'XBUTTON1': Keys.VK_XBUTTON1,                      #X1 mouse button
-    'XBUTTON2': Keys.VK_XBUTTON2,                      #X2 mouse button
-    'BACK': Keys.VK_BACK,                              #BACKSPACE key
-    'TAB': Keys.VK_TAB,                                #TAB key
-    'CLEAR': Keys.VK_CLEAR,                            #CLEAR key
-    'RETURN': Keys.VK_RETURN,                          #ENTER key
-    'ENTER': Keys.VK_RETURN,                           #ENTER key
-    'SHIFT': Keys.VK_SHIFT,                            #SHIFT key
-    'CTRL': Keys.VK_CONTROL,                           #CTRL key
-    'CONTROL': Keys.VK_CONTROL,                        #CTRL key
-    'ALT': Keys.VK_MENU,                               #ALT key
-    'PAUSE': Keys.VK_PAUSE,                            #PAUSE key
-    'CAPITAL': Keys.VK_CAPITAL,                        #CAPS LOCK key
-    'KANA': Keys.VK_KANA,                              #IME Kana mode
-    'HANGUEL': Keys.VK_HANGUEL,                        #IME Hanguel mode (maintained for compatibility; use VK_HANGUL)
-    'HANGUL': Keys.VK_HANGUL,                          #IME Hangul mode
-    'JUNJA': Keys.VK_JUNJA,                            #IME Junja mode
-    'FINAL': Keys.VK_FINAL,                            #IME final mode
-    'HANJA': Keys.VK_HANJA,                            #IME Hanja mode
-    'KANJI': Keys.VK_KANJI,                            #IME Kanji mode
-    'ESC': Keys.VK_ESCAPE,                             #ESC key
-    'ESCAPE': Keys.VK_ESCAPE,                          #ESC key
-    'CONVERT': Keys.VK_CONVERT,                        #IME convert
-    'NONCONVERT': Keys.VK_NONCONVERT,                  #IME nonconvert
-    'ACCEPT': Keys.VK_ACCEPT,                          #IME accept
-    'MODECHANGE': Keys.VK_MODECHANGE,                  #IME mode change request
-    'SPACE': Keys.VK_SPACE,                            #SPACEBAR
-    'PRIOR': Keys.VK_PRIOR,                            #PAGE UP key
-    'PAGEUP': Keys.VK_PRIOR,                           #PAGE UP key
-    'NEXT': Keys.VK_NEXT,                              #PAGE DOWN key
-    'PAGEDOWN': Keys.VK_NEXT,                           #PAGE DOWN key
-    'END': Keys.VK_END,                                #END key
-    'HOME': Keys.VK_HOME,                              #HOME key
-    'LEFT': Keys.VK_LEFT,                              #LEFT ARROW key
-    'UP': Keys.VK_UP,                                  #UP ARROW key
-    'RIGHT': Keys.VK_RIGHT,                            #RIGHT ARROW key
-    'DOWN': Keys.VK_DOWN,                              #DOWN ARROW key
-    'SELECT': Keys.VK_SELECT,                          #SELECT key
-    'PRINT': Keys.VK_PRINT,                            #PRINT key
-    'EXECUTE': Keys.VK_EXECUTE,                        #EXECUTE key
-    'SNAPSHOT': Keys.VK_SNAPSHOT,                      #PRINT SCREEN key
-    'PRINTSCREEN': Keys.VK_SNAPSHOT,                    #PRINT SCREEN key
-    'INSERT': Keys.VK_INSERT,                          #INS key
-    'INS': Keys.VK_INSERT,                             #INS key
-    'DELETE': Keys.VK_DELETE,                          #DEL key
-    'DEL': Keys.VK_DELETE,                             #DEL key
-    'HELP': Keys.VK_HELP,                              #HELP key
-    'WIN': Keys.VK_LWIN,                               #Left Windows key (Natural keyboard)
-    'LWIN': Keys.VK_LWIN,                              #Left Windows key (Natural keyboard)
-    'RWIN': Keys.VK_RWIN,                              #Right Windows key (Natural keyboard)
-    'APPS': Keys.VK_APPS,                              #Applications key (Natural keyboard)
-    'SLEEP': Keys.VK_SLEEP,                            #Computer Sleep key
-    'NUMPAD0': Keys.VK_NUMPAD0,                        #Numeric keypad 0 key
-    'NUMPAD1': Keys.VK_NUMPAD1,                        #Numeric keypad 1 key
-    'NUMPAD2': Keys.VK_NUMPAD2,                        #Numeric keypad 2 key
-    'NUMPAD3': Keys.VK_NUMPAD3,                        #Numeric keypad 3 key
-    'NUMPAD4': Keys.VK_NUMPAD4,                        #Numeric keypad 4 key
-    'NUMPAD5': Keys.VK_NUMPAD5,                        #Numeric keypad 5 key
-    'NUMPAD6': Keys.VK_NUMPAD6,                        #Numeric keypad 6 key
-    'NUMPAD7': Keys.VK_NUMPAD7,                        #Numeric keypad 7 key
-    'NUMPAD8': Keys.VK_NUMPAD8,                        #Numeric keypad 8 key
-    'NUMPAD9': Keys.VK_NUMPAD9,                        #Numeric keypad 9 key
-    'MULTIPLY': Keys.VK_MULTIPLY,                      #Multiply key
-    'ADD': Keys.VK_ADD,                                #Add key
-    'SEPARATOR': Keys.VK_SEPARATOR,                    #Separator key
-    'SUBTRACT': Keys.VK_SUBTRACT,                      #Subtract key
-    'DECIMAL': Keys.VK_DECIMAL,                        #Decimal key
-    'DIVIDE': Keys.VK_DIVIDE,                          #Divide key
-    'F1': Keys.VK_F1,                                  #F1 key
-    'F2': Keys.VK_F2,                                  #F2 key
-    'F3': Keys.VK_F3,                                  #F3 key
-    'F4': Keys.VK_F4,                                  #F4 key
-    'F5': Keys.VK_F5,                                  #F5 key
-    'F6': Keys.VK_F6,                                  #F6 key
-    'F7': Keys.VK_F7,                                  #F7 key
-    'F8': Keys.VK_F8,                                  #F8 key
-    'F9': Keys.VK_F9,                                  #F9 key
-    'F10': Keys.VK_F10,                                #F10 key
-    'F11': Keys.VK_F11,                                #F11 key
-    'F12': Keys.VK_F12,                                #F12 key
-    'F13': Keys.VK_F13,                                #F13 key
-    'F14': Keys.VK_F14,                                #F14 key
-    'F15': Keys.VK_F15,                                #F15 key
-    'F16': Keys.VK_F16,                                #F16 key
-    'F17': Keys.VK_F17,                                #F17 key
-    'F18': Keys.VK_F18,                                #F18 key
-    'F19': Keys.VK_F19,                                #F19 key
-    'F20': Keys.VK_F20,                                #F20 key
-    'F21': Keys.VK_F21,                                #F21 key
-    'F22': Keys.VK_F22,                                #F22 key
-    'F23': Keys.VK_F23,                                #F23 key
-    'F24': Keys.VK_F24,                                #F24 key
-    'NUMLOCK': Keys.VK_NUMLOCK,                        #NUM LOCK key
-    'SCROLL': Keys.VK_SCROLL,                          #SCROLL LOCK key
-    'LSHIFT': Keys.VK_LSHIFT,                          #Left SHIFT key
-    'RSHIFT': Keys.VK_RSHIFT,                          #Right SHIFT key
-    'LCONTROL': Keys.VK_LCONTROL,                      #Left CONTROL key
-    'LCTRL': Keys.VK_LCONTROL,                         #Left CONTROL key
-    'RCONTROL': Keys.VK_RCONTROL,                      #Right CONTROL key
-    'RCTRL': Keys.VK_RCONTROL,                         #Right CONTROL key
-    'LALT': Keys.VK_LMENU,                             #Left MENU key
-    'RALT': Keys.VK_RMENU,                             #Right MENU key
-    'BROWSER_BACK': Keys.VK_BROWSER_BACK,              #Browser Back key
-    'BROWSER_FORWARD': Keys.VK_BROWSER_FORWARD,        #Browser Forward key
-    'BROWSER_REFRESH': Keys.VK_BROWSER_REFRESH,        #Browser Refresh key
-    'BROWSER_STOP': Keys.VK_BROWSER_STOP,              #Browser Stop key
-    'BROWSER_SEARCH': Keys.VK_BROWSER_SEARCH,          #Browser Search key
-    'BROWSER_FAVORITES': Keys.VK_BROWSER_FAVORITES,    #Browser Favorites key
-    'BROWSER_HOME': Keys.VK_BROWSER_HOME,              #Browser Start and Home key
-    'VOLUME_MUTE': Keys.VK_VOLUME_MUTE,                #Volume Mute key
-    'VOLUME_DOWN': Keys.VK_VOLUME_DOWN,                #Volume Down key
-    'VOLUME_UP': Keys.VK_VOLUME_UP,                    #Volume Up key
-    'MEDIA_NEXT_TRACK': Keys.VK_MEDIA_NEXT_TRACK,      #Next Track key
-    'MEDIA_PREV_TRACK': Keys.VK_MEDIA_PREV_TRACK,      #Previous Track key
-    'MEDIA_STOP': Keys.VK_MEDIA_STOP,                  #Stop Media key
-    'MEDIA_PLAY_PAUSE': Keys.VK_MEDIA_PLAY_PAUSE,      #Play/Pause Media key
-    'LAUNCH_MAIL': Keys.VK_LAUNCH_MAIL,                #Start Mail key
-    'LAUNCH_MEDIA_SELECT': Keys.VK_LAUNCH_MEDIA_SELECT,#Select Media key
-    'LAUNCH_APP1': Keys.VK_LAUNCH_APP1,                #Start Application 1 key
-    'LAUNCH_APP2': Keys.VK_LAUNCH_APP2,                #Start Application 2 key
-    'OEM_1': Keys.VK_OEM_1,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the ';:' key
-    'OEM_PLUS': Keys.VK_OEM_PLUS,                      #For any country/region, the '+' key
-    'OEM_COMMA': Keys.VK_OEM_COMMA,                    #For any country/region, the ',' key
-    'OEM_MINUS': Keys.VK_OEM_MINUS,                    #For any country/region, the '-' key
-    'OEM_PERIOD': Keys.VK_OEM_PERIOD,                  #For any country/region, the '.' key
-    'OEM_2': Keys.VK_OEM_2,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '/?' key
-    'OEM_3': Keys.VK_OEM_3,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '`~' key
-    'OEM_4': Keys.VK_OEM_4,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '[{' key
-    'OEM_5': Keys.VK_OEM_5,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '\|' key
-    'OEM_6': Keys.VK_OEM_6,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the ']}' key
-    'OEM_7': Keys.VK_OEM_7,                            #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the 'single-quote/double-quote' key
-    'OEM_8': Keys.VK_OEM_8,                            #Used for miscellaneous characters; it can vary by keyboard.
-    'OEM_102': Keys.VK_OEM_102,                        #Either the angle bracket key or the backslash key on the RT 102-key keyboard
-    'PROCESSKEY': Keys.VK_PROCESSKEY,                  #IME PROCESS key
-    'PACKET': Keys.VK_PACKET,                          #Used to pass Unicode characters as if they were keystrokes. The VK_PACKET key is the low word of a 32-bit Virtual Key value used for non-keyboard input methods. For more information, see Remark in KEYBDINPUT, SendInput, WM_KEYDOWN, and WM_KeyUp
-    'ATTN': Keys.VK_ATTN,                              #Attn key
-    'CRSEL': Keys.VK_CRSEL,                            #CrSel key
-    'EXSEL': Keys.VK_EXSEL,                            #ExSel key
-    'EREOF': Keys.VK_EREOF,                            #Erase EOF key
-    'PLAY': Keys.VK_PLAY,                              #Play key
-    'ZOOM': Keys.VK_ZOOM,                              #Zoom key
-    'NONAME': Keys.VK_NONAME,                          #Reserved
-    'PA1': Keys.VK_PA1,                                #PA1 key
-    'OEM_CLEAR': Keys.VK_OEM_CLEAR,                    #Clear key
-}
-
-
-CharacterCodes = {
+# value to name lookup, iterating an IntEnum skips aliases so each value maps to its first declared name
+VK_TO_NAME: Final[Mapping[int, str]] = MappingProxyType({m.value: m.name for m in Keys})
+
+
+SpecialKeyNames = MappingProxyType({
+    'LBUTTON': 0x01,                                   #Left mouse button
+    'RBUTTON': 0x02,                                   #Right mouse button
+    'CANCEL': 0x03,                                    #Control-break processing
+    'MBUTTON': 0x04,                                   #Middle mouse button (three-button mouse)
+    'XBUTTON1': 0x05,                                  #X1 mouse button
+    'XBUTTON2': 0x06,                                  #X2 mouse button
+    'BACK': 0x08,                                      #BACKSPACE key
+    'TAB': 0x09,                                       #TAB key
+    'CLEAR': 0x0C,                                     #CLEAR key
+    'RETURN': 0x0D,                                    #ENTER key
+    'ENTER': 0x0D,                                     #ENTER key
+    'SHIFT': 0x10,                                     #SHIFT key
+    'CTRL': 0x11,                                      #CTRL key
+    'CONTROL': 0x11,                                   #CTRL key
+    'ALT': 0x12,                                       #ALT key
+    'PAUSE': 0x13,                                     #PAUSE key
+    'CAPITAL': 0x14,                                   #CAPS LOCK key
+    'KANA': 0x15,                                      #IME Kana mode
+    'HANGUEL': 0x15,                                   #IME Hanguel mode (maintained for compatibility; use VK_HANGUL)
+    'HANGUL': 0x15,                                    #IME Hangul mode
+    'JUNJA': 0x17,                                     #IME Junja mode
+    'FINAL': 0x18,                                     #IME final mode
+    'HANJA': 0x19,                                     #IME Hanja mode
+    'KANJI': 0x19,                                     #IME Kanji mode
+    'ESC': 0x1B,                                       #ESC key
+    'ESCAPE': 0x1B,                                    #ESC key
+    'CONVERT': 0x1C,                                   #IME convert
+    'NONCONVERT': 0x1D,                                #IME nonconvert
+    'ACCEPT': 0x1E,                                    #IME accept
+    'MODECHANGE': 0x1F,                                #IME mode change request
+    'SPACE': 0x20,                                     #SPACEBAR
+    'PRIOR': 0x21,                                     #PAGE UP key
+    'PAGEUP': 0x21,                                    #PAGE UP key
+    'NEXT': 0x22,                                      #PAGE DOWN key
+    'PAGEDOWN': 0x22,                                   #PAGE DOWN key
+    'END': 0x23,                                       #END key
+    'HOME': 0x24,                                      #HOME key
+    'LEFT': 0x25,                                      #LEFT ARROW key
+    'UP': 0x26,                                        #UP ARROW key
+    'RIGHT': 0x27,                                     #RIGHT ARROW key
+    'DOWN': 0x28,                                      #DOWN ARROW key
+    'SELECT': 0x29,                                    #SELECT key
+    'PRINT': 0x2A,                                     #PRINT key
+    'EXECUTE': 0x2B,                                   #EXECUTE key
+    'SNAPSHOT': 0x2C,                                  #PRINT SCREEN key
+    'PRINTSCREEN': 0x2C,                                #PRINT SCREEN key
+    'INSERT': 0x2D,                                    #INS key
+    'INS': 0x2D,                                       #INS key
+    'DELETE': 0x2E,                                    #DEL key
+    'DEL': 0x2E,                                       #DEL key
+    'HELP': 0x2F,                                      #HELP key
+    'WIN': 0x5B,                                       #Left Windows key (Natural keyboard)
+    'LWIN': 0x5B,                                      #Left Windows key (Natural keyboard)
+    'RWIN': 0x5C,                                      #Right Windows key (Natural keyboard)
+    'APPS': 0x5D,                                      #Applications key (Natural keyboard)
+    'SLEEP': 0x5F,                                     #Computer Sleep key
+    'NUMPAD0': 0x60,                                   #Numeric keypad 0 key
+    'NUMPAD1': 0x61,                                   #Numeric keypad 1 key
+    'NUMPAD2': 0x62,                                   #Numeric keypad 2 key
+    'NUMPAD3': 0x63,                                   #Numeric keypad 3 key
+    'NUMPAD4': 0x64,                                   #Numeric keypad 4 key
+    'NUMPAD5': 0x65,                                   #Numeric keypad 5 key
+    'NUMPAD6': 0x66,                                   #Numeric keypad 6 key
+    'NUMPAD7': 0x67,                                   #Numeric keypad 7 key
+    'NUMPAD8': 0x68,                                   #Numeric keypad 8 key
+    'NUMPAD9': 0x69,                                   #Numeric keypad 9 key
+    'MULTIPLY': 0x6A,                                  #Multiply key
+    'ADD': 0x6B,                                       #Add key
+    'SEPARATOR': 0x6C,                                 #Separator key
+    'SUBTRACT': 0x6D,                                  #Subtract key
+    'DECIMAL': 0x6E,                                   #Decimal key
+    'DIVIDE': 0x6F,                                    #Divide key
+    'F1': 0x70,                                        #F1 key
+    'F2': 0x71,                                        #F2 key
+    'F3': 0x72,                                        #F3 key
+    'F4': 0x73,                                        #F4 key
+    'F5': 0x74,                                        #F5 key
+    'F6': 0x75,                                        #F6 key
+    'F7': 0x76,                                        #F7 key
+    'F8': 0x77,                                        #F8 key
+    'F9': 0x78,                                        #F9 key
+    'F10': 0x79,                                       #F10 key
+    'F11': 0x7A,                                       #F11 key
+    'F12': 0x7B,                                       #F12 key
+    'F13': 0x7C,                                       #F13 key
+    'F14': 0x7D,                                       #F14 key
+    'F15': 0x7E,                                       #F15 key
+    'F16': 0x7F,                                       #F16 key
+    'F17': 0x80,                                       #F17 key
+    'F18': 0x81,                                       #F18 key
+    'F19': 0x82,                                       #F19 key
+    'F20': 0x83,                                       #F20 key
+    'F21': 0x84,                                       #F21 key
+    'F22': 0x85,                                       #F22 key
+    'F23': 0x86,                                       #F23 key
+    'F24': 0x87,                                       #F24 key
+    'NUMLOCK': 0x90,                                   #NUM LOCK key
+    'SCROLL': 0x91,                                    #SCROLL LOCK key
+    'LSHIFT': 0xA0,                                    #Left SHIFT key
+    'RSHIFT': 0xA1,                                    #Right SHIFT key
+    'LCONTROL': 0xA2,                                  #Left CONTROL key
+    'LCTRL': 0xA2,                                     #Left CONTROL key
+    'RCONTROL': 0xA3,                                  #Right CONTROL key
+    'RCTRL': 0xA3,                                     #Right CONTROL key
+    'LALT': 0xA4,                                      #Left MENU key
+    'RALT': 0xA5,                                      #Right MENU key
+    'BROWSER_BACK': 0xA6,                              #Browser Back key
+    'BROWSER_FORWARD': 0xA7,                           #Browser Forward key
+    'BROWSER_REFRESH': 0xA8,                           #Browser Refresh key
+    'BROWSER_STOP': 0xA9,                              #Browser Stop key
+    'BROWSER_SEARCH': 0xAA,                            #Browser Search key
+    'BROWSER_FAVORITES': 0xAB,                         #Browser Favorites key
+    'BROWSER_HOME': 0xAC,                              #Browser Start and Home key
+    'VOLUME_MUTE': 0xAD,                               #Volume Mute key
+    'VOLUME_DOWN': 0xAE,                               #Volume Down key
+    'VOLUME_UP': 0xAF,                                 #Volume Up key
+    'MEDIA_NEXT_TRACK': 0xB0,                          #Next Track key
+    'MEDIA_PREV_TRACK': 0xB1,                          #Previous Track key
+    'MEDIA_STOP': 0xB2,                                #Stop Media key
+    'MEDIA_PLAY_PAUSE': 0xB3,                          #Play/Pause Media key
+    'LAUNCH_MAIL': 0xB4,                               #Start Mail key
+    'LAUNCH_MEDIA_SELECT': 0xB5,                       #Select Media key
+    'LAUNCH_APP1': 0xB6,                               #Start Application 1 key
+    'LAUNCH_APP2': 0xB7,                               #Start Application 2 key
+    'OEM_1': 0xBA,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the ';:' key
+    'OEM_PLUS': 0xBB,                                  #For any country/region, the '+' key
+    'OEM_COMMA': 0xBC,                                 #For any country/region, the ',' key
+    'OEM_MINUS': 0xBD,                                 #For any country/region, the '-' key
+    'OEM_PERIOD': 0xBE,                                #For any country/region, the '.' key
+    'OEM_2': 0xBF,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '/?' key
+    'OEM_3': 0xC0,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '`~' key
+    'OEM_4': 0xDB,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '[{' key
+    'OEM_5': 0xDC,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the '\|' key
+    'OEM_6': 0xDD,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the ']}' key
+    'OEM_7': 0xDE,                                     #Used for miscellaneous characters; it can vary by keyboard.For the US standard keyboard, the 'single-quote/double-quote' key
+    'OEM_8': 0xDF,                                     #Used for miscellaneous characters; it can vary by keyboard.
+    'OEM_102': 0xE2,                                   #Either the angle bracket key or the backslash key on the RT 102-key keyboard
+    'PROCESSKEY': 0xE5,                                #IME PROCESS key
+    'PACKET': 0xE7,                                    #Used to pass Unicode characters as if they were keystrokes. The VK_PACKET key is the low word of a 32-bit Virtual Key value used for non-keyboard input methods. For more information, see Remark in KEYBDINPUT, SendInput, WM_KEYDOWN, and WM_KeyUp
+    'ATTN': 0xF6,                                      #Attn key
+    'CRSEL': 0xF7,                                     #CrSel key
+    'EXSEL': 0xF8,                                     #ExSel key
+    'EREOF': 0xF9,                                     #Erase EOF key
+    'PLAY': 0xFA,                                      #Play key
+    'ZOOM': 0xFB,                                      #Zoom key
+    'NONAME': 0xFC,                                    #Reserved
+    'PA1': 0xFD,                                       #PA1 key
+    'OEM_CLEAR': 0xFE,                                 #Clear key
+})
+
+
+CharacterCodes = MappingProxyType({
     '0': Keys.VK_0,                             #0 key
     '1': Keys.VK_1,                             #1 key
     '2': Keys.VK_2,                             #2 key
@@ -1480,58 +1236,7 @@ CharacterCodes = {
     '7': Keys.VK_7,                             #7 key
     '8': Keys.VK_8,                             #8 key
     '9': Keys.VK_9,                             #9 key
-    'a': Keys.VK_A,                             #A key
-    'A': Keys.VK_A,                             #A key
-    'b': Keys.VK_B,                             #B key
-    'B': Keys.VK_B,                             #B key
-    'c': Keys.VK_C,                             #C key
-    'C': Keys.VK_C,                             #C key
-    'd': Keys.VK_D,                             #D key
-    'D': Keys.VK_D,                             #D key
-    'e': Keys.VK_E,                             #E key
-    'E': Keys.VK_E,                             #E key
-    'f': Keys.VK_F,                             #F key
-    'F': Keys.VK_F,                             #F key
-    'g': Keys.VK_G,                             #G key
-    'G': Keys.VK_G,                             #G key
-    'h': Keys.VK_H,                             #H key
-    'H': Keys.VK_H,                             #H key
-    'i': Keys.VK_I,                             #I key
-    'I': Keys.VK_I,                             #I key
-    'j': Keys.VK_J,                             #J key
-    'J': Keys.VK_J,                             #J key
-    'k': Keys.VK_K,                             #K key
-    'K': Keys.VK_K,                             #K key
-    'l': Keys.VK_L,                             #L key
-    'L': Keys.VK_L,                             #L key
-    'm': Keys.VK_M,                             #M key
-    'M': Keys.VK_M,                             #M key
-    'n': Keys.VK_N,                             #N key
-    'N': Keys.VK_N,                             #N key
-    'o': Keys.VK_O,                             #O key
-    'O': Keys.VK_O,                             #O key
-    'p': Keys.VK_P,                             #P key
-    'P': Keys.VK_P,                             #P key
-    'q': Keys.VK_Q,                             #Q key
-    'Q': Keys.VK_Q,                             #Q key
-    'r': Keys.VK_R,                             #R key
-    'R': Keys.VK_R,                             #R key
-    's': Keys.VK_S,                             #S key
-    'S': Keys.VK_S,                             #S key
-    't': Keys.VK_T,                             #T key
-    'T': Keys.VK_T,                             #T key
-    'u': Keys.VK_U,                             #U key
-    'U': Keys.VK_U,                             #U key
-    'v': Keys.VK_V,                             #V key
-    'V': Keys.VK_V,                             #V key
-    'w': Keys.VK_W,                             #W key
-    'W': Keys.VK_W,                             #W key
-    'x': Keys.VK_X,                             #X key
-    'X': Keys.VK_X,                             #X key
-    'y': Keys.VK_Y,                             #Y key
-    'Y': Keys.VK_Y,                             #Y key
-    'z': Keys.VK_Z,                             #Z key
-    'Z': Keys.VK_Z,                             #Z key
+    **{char: Keys['VK_' + char.upper()] for char in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'},  #a-z, A-Z keys
     ' ': Keys.VK_SPACE,                         #Space key
     '`': Keys.VK_OEM_3,                         #` key
     #'~' : Keys.VK_OEM_3,                         #~ key
@@ -1555,40 +1260,58 @@ CharacterCodes = {
     #'>' : Keys.VK_OEM_PERIOD,                    #> key
     '/': Keys.VK_OEM_2,                         #/ key
     #'?' : Keys.VK_OEM_2,                         #? key
-}
+})
+
+# CharacterCodes indexed by ord(char) for ASCII, 0 for the chars not in it
+_CharVK = [0] * 128
+for _char, _vk in CharacterCodes.items():
+    _CharVK[ord(_char)] = _vk
+del _char, _vk
+
+
+def CharToVK(char: str) -> int:
+    """
+    Return the virtual key code in `CharacterCodes` for a single char, 0 if char is not in it.
+    """
+    code = ord(char)
+    return _CharVK[code] if code < 128 else 0
+
+
+_COORD, _SMALL_RECT = ctypes.wintypes._COORD, ctypes.wintypes.SMALL_RECT
+_LONG, _DWORD, _WORD, _PULONG = ctypes.wintypes.LONG, ctypes.wintypes.DWORD, ctypes.wintypes.WORD, ctypes.wintypes.PULONG
 
 
 class ConsoleScreenBufferInfo(ctypes.Structure):
     _fields_ = [
-        ('dwSize', ctypes.wintypes._COORD),
-        ('dwCursorPosition', ctypes.wintypes._COORD),
+        ('dwSize', _COORD),
+        ('dwCursorPosition', _COORD),
         ('wAttributes', ctypes.c_uint),
-        ('srWindow', ctypes.wintypes.SMALL_RECT),
-        ('dwMaximumWindowSize', ctypes.wintypes._COORD),
+        ('srWindow', _SMALL_RECT),
+        ('dwMaximumWindowSize', _COORD),
     ]
 
 
 class MOUSEINPUT(ctypes.Structure):
-    _fields_ = (('dx', ctypes.wintypes.LONG),
-                ('dy', ctypes.wintypes.LONG),
-                ('mouseData', ctypes.wintypes.DWORD),
-                ('dwFlags', ctypes.wintypes.DWORD),
-                ('time', ctypes.wintypes.DWORD),
-                ('dwExtraInfo', ctypes.wintypes.PULONG))
+    _fields_ = (('dx', _LONG),
+                ('dy', _LONG),
+                ('mouseData', _DWORD),
+                ('dwFlags', _DWORD),
+                ('time', _DWORD),
+                ('dwExtraInfo', _PULONG))
 
 
 class KEYBDINPUT(ctypes.Structure):
-    _fields_ = (('wVk', ctypes.wintypes.WORD),
-                ('wScan', ctypes.wintypes.WORD),
-                ('dwFlags', ctypes.wintypes.DWORD),
-                ('time', ctypes.wintypes.DWORD),
-                ('dwExtraInfo', ctypes.wintypes.PULONG))
+    _fields_ = (('wVk', _WORD),
+                ('wScan', _WORD),
+                ('dwFlags', _DWORD),
+                ('time', _DWORD),
+                ('dwExtraInfo', _PULONG))
 
 
 class HARDWAREINPUT(ctypes.Structure):
-    _fields_ = (('uMsg', ctypes.wintypes.DWORD),
-                ('wParamL', ctypes.wintypes.WORD),
-                ('wParamH', ctypes.wintypes.WORD))
+    _fields_ = (('uMsg', _DWORD),
+                ('wParamL', _WORD),
+                ('wParamH', _WORD))
 
 
 class _INPUTUnion(ctypes.Union):
@@ -1598,57 +1321,25 @@ class _INPUTUnion(ctypes.Union):
 
 
 class INPUT(ctypes.Structure):
-    _fields_ = (('type', ctypes.wintypes.DWORD),
+    _fields_ = (('type', _DWORD),
                 ('union', _INPUTUnion))
 
 
-class Rect():
+class _RegisteredClipboardFormat:
     """
-    class Rect, like `ctypes.wintypes.RECT`.
+    Class attribute that calls RegisterClipboardFormatW on first access and keeps the returned format id.
     """
+    __slots__ = ('_formatName', '_formatId')
 
-    def __init__(self, left: int = 0, top: int = 0, right: int = 0, bottom: int = 0):
-        self.left = left
-        self.top = top
-        self.right = right
-        self.bottom = bottom
-
-    def width(self) -> int:
-        return self.right - self.left
-
-    def height(self) -> int:
-        return self.bottom - self.top
-
-    def xcenter(self) -> int:
-        return self.left + self.width() // 2
-
-    def ycenter(self) -> int:
-        return self.top + self.height() // 2
-
-    def isempty(self) -> int:
-        return self.width() == 0 or self.height() == 0
-
-    def contains(self, x: int, y: int) -> bool:
-        return self.left <= x < self.right and self.top <= y < self.bottom
-
-    def intersect(self, rect: 'Rect') -> 'Rect':
-        left, top, right, bottom = max(self.left, rect.left), max(self.top, rect.top), min(self.right, rect.right), min(self.bottom, rect.bottom)
-        return Rect(left, top, right, bottom)
-
-    def offset(self, x: int, y: int) -> None:
-        self.left += x
-        self.right += x
-        self.top += y
-        self.bottom += y
-
-    def __eq__(self, rect):
-        return self.left == rect.left and self.top == rect.top and self.right == rect.right and self.bottom == rect.bottom
-
-    def __str__(self) -> str:
-        return '({},{},{},{})[{}x{}]'.format(self.left, self.top, self.right, self.bottom, self.width(), self.height())
+    def __init__(self, formatName: str):
+        self._formatName = formatName
+        self._formatId = 0
 
-    def __repr__(self) -> str:
-        return '{}({},{},{},{})[{}x{}]'.format(self.__class__.__name__, self.left, self.top, self.right, self.bottom, self.width(), self.height())
+    def __get__(self, instance: Any, owner: type) -> int:
+        formatId = self._formatId
+        if not formatId:
+            formatId = self._formatId = ctypes.windll.user32.RegisterClipboardFormatW(self._formatName)
+        return formatId
 
 
 class ClipboardFormat:
@@ -1670,7 +1361,7 @@ class ClipboardFormat:
     CF_LOCALE = 16
     CF_DIBV5 = 17
     CF_MAX = 18
-    CF_HTML = ctypes.windll.user32.RegisterClipboardFormatW("HTML Format")
+    CF_HTML = _RegisteredClipboardFormat("HTML Format")
 
 class ActiveEnd(IntEnum):
     ActiveEnd_None = 0
@@ -11,20 +11,13 @@ uiautomation is shared under the Apache Licene 2.0.
 This means that the code can be freely copied and distributed, and costs nothing to use.
 '''
 
-import os
 import sys
 import time
-import datetime
-import re
-import shlex
-import struct
-import atexit
-import threading
 import ctypes
 import ctypes.wintypes
+import functools
 import comtypes
-from io import TextIOWrapper
-from typing import (Any, Callable, Dict, Generator, List, Tuple, Optional, Union, Sequence, TYPE_CHECKING)
+from typing import (Any, List, Optional, TYPE_CHECKING)
 from .enums import *
 from .core import *
 from .core import _AutomationClient
@@ -43,128 +36,96 @@ DEBUG_EXIST_DISAPPEAR = False
 S_OK = 0
 
 IsPy38OrHigher = sys.version_info[:2] >= (3, 8)
-IsNT6orHigher = os.sys.getwindowsversion().major >= 6
-CurrentProcessIs64Bit = sys.maxsize > 0xFFFFFFFF
-ProcessTime = time.perf_counter  # this returns nearly 0 when first call it if python version <= 3.6
-ProcessTime()  # need to call it once if python version <= 3.6
+IsNT6orHigher = sys.getwindowsversion().major >= 6
+CurrentProcessIs64Bit = sys.maxsize.bit_length() > 32
+ProcessTime = time.perf_counter
 TreeNode = Any
 
 
-_PatternIdInterfaces = None
+_PatternIdBase = int(PatternId.InvokePattern)  # pattern ids are the contiguous range 10000..10034
+
+
+@functools.lru_cache(maxsize=None)
+def _GetPatternIdInterfaces() -> List[Any]:
+    """
+    Build the pattern COM interface list on the first call, indexed by patternId - _PatternIdBase.
+    Return List, an item is None if UIAutomationCore doesn't have the pattern.
+    """
+    uiaCore = _AutomationClient.instance().UIAutomationCore
+    interfaces = {
+        # PatternId.AnnotationPattern: uiaCore.IUIAutomationAnnotationPattern,
+        # PatternId.CustomNavigationPattern: uiaCore.IUIAutomationCustomNavigationPattern,
+        PatternId.DockPattern: uiaCore.IUIAutomationDockPattern,
+        # PatternId.DragPattern: uiaCore.IUIAutomationDragPattern,
+        # PatternId.DropTargetPattern: uiaCore.IUIAutomationDropTargetPattern,
+        PatternId.ExpandCollapsePattern: uiaCore.IUIAutomationExpandCollapsePattern,
+        PatternId.GridItemPattern: uiaCore.IUIAutomationGridItemPattern,
+        PatternId.GridPattern: uiaCore.IUIAutomationGridPattern,
+        PatternId.InvokePattern: uiaCore.IUIAutomationInvokePattern,
+        PatternId.ItemContainerPattern: uiaCore.IUIAutomationItemContainerPattern,
+        PatternId.LegacyIAccessiblePattern: uiaCore.IUIAutomationLegacyIAccessiblePattern,
+        PatternId.MultipleViewPattern: uiaCore.IUIAutomationMultipleViewPattern,
+        # PatternId.ObjectModelPattern: uiaCore.IUIAutomationObjectModelPattern,
+        PatternId.RangeValuePattern: uiaCore.IUIAutomationRangeValuePattern,
+        PatternId.ScrollItemPattern: uiaCore.IUIAutomationScrollItemPattern,
+        PatternId.ScrollPattern: uiaCore.IUIAutomationScrollPattern,
+        PatternId.SelectionItemPattern: uiaCore.IUIAutomationSelectionItemPattern,
+        PatternId.SelectionPattern: uiaCore.IUIAutomationSelectionPattern,
+        # PatternId.SpreadsheetItemPattern: uiaCore.IUIAutomationSpreadsheetItemPattern,
+        # PatternId.SpreadsheetPattern: uiaCore.IUIAutomationSpreadsheetPattern,
+        # PatternId.StylesPattern: uiaCore.IUIAutomationStylesPattern,
+        PatternId.SynchronizedInputPattern: uiaCore.IUIAutomationSynchronizedInputPattern,
+        PatternId.TableItemPattern: uiaCore.IUIAutomationTableItemPattern,
+        PatternId.TablePattern: uiaCore.IUIAutomationTablePattern,
+        # PatternId.TextChildPattern: uiaCore.IUIAutomationTextChildPattern,
+        # PatternId.TextEditPattern: uiaCore.IUIAutomationTextEditPattern,
+        PatternId.TextPattern: uiaCore.IUIAutomationTextPattern,
+        # PatternId.TextPattern2: uiaCore.IUIAutomationTextPattern2,
+        PatternId.TogglePattern: uiaCore.IUIAutomationTogglePattern,
+        PatternId.TransformPattern: uiaCore.IUIAutomationTransformPattern,
+        # PatternId.TransformPattern2: uiaCore.IUIAutomationTransformPattern2,
+        PatternId.ValuePattern: uiaCore.IUIAutomationValuePattern,
+        PatternId.VirtualizedItemPattern: uiaCore.IUIAutomationVirtualizedItemPattern,
+        PatternId.WindowPattern: uiaCore.IUIAutomationWindowPattern,
+    }
+    # the following patterns doesn't exist on Windows 7 or lower
+    for patternName in ('AnnotationPattern', 'CustomNavigationPattern', 'DragPattern', 'DropTargetPattern',
+                        'ObjectModelPattern', 'SpreadsheetItemPattern', 'SpreadsheetPattern', 'StylesPattern',
+                        'SelectionPattern2', 'TextChildPattern', 'TextEditPattern', 'TextPattern2',
+                        'TransformPattern2'):
+        patternInterface = getattr(uiaCore, 'IUIAutomation' + patternName, None)
+        if patternInterface is not None:
+            interfaces[PatternId[patternName]] = patternInterface
+    return [interfaces.get(id_) for id_ in range(_PatternIdBase, max(PatternId) + 1)]
 
 
 def GetPatternIdInterface(patternId: int):
     """
     Get pattern COM interface by pattern id.
     patternId: int, a value in class `PatternId`.
-    Return comtypes._cominterface_meta.
+    Return comtypes._cominterface_meta, None if patternId is unknown or UIAutomationCore doesn't have the pattern.
     """
-    global _PatternIdInterfaces
-    if not _PatternIdInterfaces:
-        _PatternIdInterfaces = {
-            # PatternId.AnnotationPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationAnnotationPattern,
-            # PatternId.CustomNavigationPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationCustomNavigationPattern,
-            PatternId.DockPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationDockPattern,
-            # PatternId.DragPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationDragPattern,
-            # PatternId.DropTargetPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationDropTargetPattern,
-            PatternId.ExpandCollapsePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationExpandCollapsePattern,
-            PatternId.GridItemPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationGridItemPattern,
-            PatternId.GridPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationGridPattern,
-            PatternId.InvokePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationInvokePattern,
-            PatternId.ItemContainerPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationItemContainerPattern,
-            PatternId.LegacyIAccessiblePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationLegacyIAccessiblePattern,
-            PatternId.MultipleViewPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationMultipleViewPattern,
-            # PatternId.ObjectModelPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationObjectModelPattern,
-            PatternId.RangeValuePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationRangeValuePattern,
-            PatternId.ScrollItemPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationScrollItemPattern,
-            PatternId.ScrollPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationScrollPattern,
-            PatternId.SelectionItemPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationSelectionItemPattern,
-            PatternId.SelectionPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationSelectionPattern,
-            # PatternId.SpreadsheetItemPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationSpreadsheetItemPattern,
-            # PatternId.SpreadsheetPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationSpreadsheetPattern,
-            # PatternId.StylesPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationStylesPattern,
-            PatternId.SynchronizedInputPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationSynchronizedInputPattern,
-            PatternId.TableItemPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTableItemPattern,
-            PatternId.TablePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTablePattern,
-            # PatternId.TextChildPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTextChildPattern,
-            # PatternId.TextEditPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTextEditPattern,
-            PatternId.TextPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTextPattern,
-            # PatternId.TextPattern2: _AutomationClient.instance().UIAutomationCore.IUIAutomationTextPattern2,
-            PatternId.TogglePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTogglePattern,
-            PatternId.TransformPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationTransformPattern,
-            # PatternId.TransformPattern2: _AutomationClient.instance().UIAutomationCore.IUIAutomationTransformPattern2,
-            PatternId.ValuePattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationValuePattern,
-            PatternId.VirtualizedItemPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationVirtualizedItemPattern,
-            PatternId.WindowPattern: _AutomationClient.instance().UIAutomationCore.IUIAutomationWindowPattern,
-        }
-        debug = False
-        # the following patterns doesn't exist on Windows 7 or lower
-        try:
-            _PatternIdInterfaces[PatternId.AnnotationPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationAnnotationPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have AnnotationPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.CustomNavigationPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationCustomNavigationPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have CustomNavigationPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.DragPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationDragPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have DragPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.DropTargetPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationDropTargetPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have DropTargetPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.ObjectModelPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationObjectModelPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have ObjectModelPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.SpreadsheetItemPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationSpreadsheetItemPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have SpreadsheetItemPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.SpreadsheetPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationSpreadsheetPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have SpreadsheetPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.StylesPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationStylesPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have StylesPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.SelectionPattern2] = _AutomationClient.instance().UIAutomationCore.IUIAutomationSelectionPattern2
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have SelectionPattern2.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.TextChildPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationTextChildPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have TextChildPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.TextEditPattern] = _AutomationClient.instance().UIAutomationCore.IUIAutomationTextEditPattern
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have TextEditPattern.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.TextPattern2] = _AutomationClient.instance().UIAutomationCore.IUIAutomationTextPattern2
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have TextPattern2.', ConsoleColor.Yellow)
-        try:
-            _PatternIdInterfaces[PatternId.TransformPattern2] = _AutomationClient.instance().UIAutomationCore.IUIAutomationTransformPattern2
-        except:
-            if debug:
-                Logger.WriteLine('UIAutomationCore does not have TransformPattern2.', ConsoleColor.Yellow)
-    return _PatternIdInterfaces[patternId]
+    interfaces = _GetPatternIdInterfaces()
+    index = patternId - _PatternIdBase
+    if 0 <= index < len(interfaces):
+        return interfaces[index]
+    return None
+
+
+def _CreateControlsFromElementArray(eleArray) -> List['Control']:
+    """
+    Create `Control` subclasses for the elements of a IUIAutomationElementArray, elements that can't be wrapped are skipped.
+    Return List[Control].
+    """
+    from .controls import Control  # controls imports this module
+    createControl = Control.CreateControlFromElement
+    getElement = eleArray.GetElement
+    controls = []
+    for i in range(eleArray.Length):
+        con = createControl(getElement(i))
+        if con:
+            controls.append(con)
+    return controls
 
 
 """
@@ -174,6 +135,8 @@ Refer https://docs.microsoft.com/en-us/previous-versions//dd319586(v=vs.85)
 
 
 class AnnotationPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationannotationpattern"""
         self.pattern = pattern
@@ -228,6 +191,8 @@ class AnnotationPattern():
 
 
 class CustomNavigationPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationcustomnavigationpattern"""
         self.pattern = pattern
@@ -245,6 +210,8 @@ class CustomNavigationPattern():
 
 
 class DockPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationdockpattern"""
         self.pattern = pattern
@@ -259,19 +226,22 @@ class DockPattern():
         """
         return self.pattern.CurrentDockPosition
 
-    def SetDockPosition(self, dockPosition: int, waitTime: float = OPERATION_WAIT_TIME) -> int:
+    def SetDockPosition(self, dockPosition: int, waitTime: float = 0) -> int:
         """
         Call IUIAutomationDockPattern::SetDockPosition.
         dockPosition: int, a value in class `DockPosition`.
-        waitTime: float.
+        waitTime: float, seconds to sleep after the call, 0 by default, pass `OPERATION_WAIT_TIME` to let the UI settle.
         Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomationdockpattern-setdockposition
         """
         ret = self.pattern.SetDockPosition(dockPosition)
-        time.sleep(waitTime)
+        if waitTime:
+            time.sleep(waitTime)
         return ret
 
 
 class DragPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationdragpattern"""
         self.pattern = pattern
@@ -317,17 +287,13 @@ class DragPattern():
         """
         eleArray = self.pattern.GetCurrentGrabbedItems()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
 
 class DropTargetPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationdroptargetpattern"""
         self.pattern = pattern
@@ -357,6 +323,8 @@ class DropTargetPattern():
 
 
 class ExpandCollapsePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationexpandcollapsepattern"""
         self.pattern = pattern
@@ -371,31 +339,33 @@ class ExpandCollapsePattern():
         """
         return self.pattern.CurrentExpandCollapseState
 
-    def Collapse(self, waitTime: float = OPERATION_WAIT_TIME) -> bool:
+    def Collapse(self, waitTime: float = 0) -> bool:
         """
         Call IUIAutomationExpandCollapsePattern::Collapse.
-        waitTime: float.
+        waitTime: float, seconds to sleep after the call, 0 by default, pass `OPERATION_WAIT_TIME` to let the UI settle.
         Return bool, True if succeed otherwise False.
         Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomationexpandcollapsepattern-collapse
         """
         try:
             ret = self.pattern.Collapse() == S_OK
-            time.sleep(waitTime)
+            if waitTime:
+                time.sleep(waitTime)
             return ret
         except:
             pass
         return False
 
-    def Expand(self, waitTime: float = OPERATION_WAIT_TIME) -> bool:
+    def Expand(self, waitTime: float = 0) -> bool:
         """
         Call IUIAutomationExpandCollapsePattern::Expand.
-        waitTime: float.
+        waitTime: float, seconds to sleep after the call, 0 by default, pass `OPERATION_WAIT_TIME` to let the UI settle.
         Return bool, True if succeed otherwise False.
         Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomationexpandcollapsepattern-expand
         """
         try:
             ret = self.pattern.Expand() == S_OK
-            time.sleep(waitTime)
+            if waitTime:
+                time.sleep(waitTime)
             return ret
         except:
             pass
@@ -403,6 +373,8 @@ class ExpandCollapsePattern():
 
 
 class GridItemPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationgriditempattern"""
         self.pattern = pattern
@@ -459,6 +431,8 @@ class GridItemPattern():
 
 
 class GridPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationgridpattern"""
         self.pattern = pattern
@@ -493,24 +467,29 @@ class GridPattern():
 
 
 class InvokePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationinvokepattern"""
         self.pattern = pattern
 
-    def Invoke(self, waitTime: float = OPERATION_WAIT_TIME) -> bool:
+    def Invoke(self, waitTime: float = 0) -> bool:
         """
         Call IUIAutomationInvokePattern::Invoke.
         Invoke the action of a control, such as a button click.
-        waitTime: float.
+        waitTime: float, seconds to sleep after the call, 0 by default, pass `OPERATION_WAIT_TIME` to let the UI settle.
         Return bool, True if succeed otherwise False.
         Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nf-uiautomationclient-iuiautomationinvokepattern-invoke
         """
         ret = self.pattern.Invoke() == S_OK
-        time.sleep(waitTime)
+        if waitTime:
+            time.sleep(waitTime)
         return ret
 
 
 class ItemContainerPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationitemcontainerpattern"""
         self.pattern = pattern
@@ -529,6 +508,8 @@ class ItemContainerPattern():
 
 
 class LegacyIAccessiblePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationlegacyiaccessiblepattern"""
         self.pattern = pattern
@@ -644,13 +625,7 @@ class LegacyIAccessiblePattern():
         """
         eleArray = self.pattern.GetCurrentSelection()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
     def GetIAccessible(self):
@@ -690,6 +665,8 @@ class LegacyIAccessiblePattern():
 
 
 class MultipleViewPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationmultipleviewpattern"""
         self.pattern = pattern
@@ -733,6 +710,8 @@ class MultipleViewPattern():
 
 
 class ObjectModelPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationobjectmodelpattern"""
         self.pattern = pattern
@@ -747,6 +726,8 @@ class ObjectModelPattern():
 
 
 class RangeValuePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationrangevaluepattern"""
         self.pattern = pattern
@@ -828,6 +809,8 @@ class RangeValuePattern():
 
 
 class ScrollItemPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationscrollitempattern"""
         self.pattern = pattern
@@ -845,6 +828,7 @@ class ScrollItemPattern():
 
 
 class ScrollPattern():
+    __slots__ = ('pattern',)
     NoScrollValue = -1
 
     def __init__(self, pattern=None):
@@ -941,6 +925,8 @@ class ScrollPattern():
 
 
 class SelectionItemPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationselectionitempattern"""
         self.pattern = pattern
@@ -1004,6 +990,8 @@ class SelectionItemPattern():
 
 
 class SelectionPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationselectionpattern"""
         self.pattern = pattern
@@ -1036,13 +1024,7 @@ class SelectionPattern():
         """
         eleArray = self.pattern.GetCurrentSelection()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
 
@@ -1050,6 +1032,8 @@ class SelectionPattern2(SelectionPattern):
     """
     Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationselectionpattern2
     """
+    __slots__ = ()
+
     def __init__(self, pattern=None):
         super().__init__(pattern)
 
@@ -1093,6 +1077,8 @@ class SelectionPattern2(SelectionPattern):
 
 
 class SpreadsheetItemPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationspreadsheetitempattern"""
         self.pattern = pattern
@@ -1115,13 +1101,7 @@ class SpreadsheetItemPattern():
         """
         eleArray = self.pattern.GetCurrentAnnotationObjects()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
     def GetAnnotationTypes(self) -> List[int]:
@@ -1135,6 +1115,8 @@ class SpreadsheetItemPattern():
 
 
 class SpreadsheetPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationspreadsheetpattern"""
         self.pattern = pattern
@@ -1151,6 +1133,8 @@ class SpreadsheetPattern():
 
 
 class StylesPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationstylespattern"""
         self.pattern = pattern
@@ -1217,6 +1201,8 @@ class StylesPattern():
 
 
 class SynchronizedInputPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationsynchronizedinputpattern"""
         self.pattern = pattern
@@ -1241,6 +1227,8 @@ class SynchronizedInputPattern():
 
 
 class TableItemPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtableitempattern"""
         self.pattern = pattern
@@ -1253,13 +1241,7 @@ class TableItemPattern():
         """
         eleArray = self.pattern.GetCurrentColumnHeaderItems()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
     def GetRowHeaderItems(self) -> List['Control']:
@@ -1270,17 +1252,13 @@ class TableItemPattern():
         """
         eleArray = self.pattern.GetCurrentRowHeaderItems()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
 
 class TablePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtablepattern"""
         self.pattern = pattern
@@ -1303,13 +1281,7 @@ class TablePattern():
         """
         eleArray = self.pattern.GetCurrentColumnHeaders()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
     def GetRowHeaders(self) -> List['Control']:
@@ -1320,17 +1292,13 @@ class TablePattern():
         """
         eleArray = self.pattern.GetCurrentRowHeaders()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
 
 class TextRange():
+    __slots__ = ('textRange',)
+
     def __init__(self, textRange=None):
         """
         Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtextrange
@@ -1459,13 +1427,7 @@ class TextRange():
         """
         eleArray = self.textRange.GetChildren()
         if eleArray:
-            controls = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                con = Control.CreateControlFromElement(element=ele)
-                if con:
-                    controls.append(con)
-            return controls
+            return _CreateControlsFromElementArray(eleArray)
         return []
 
     def GetEnclosingControl(self) -> 'Control':
@@ -1574,6 +1536,8 @@ class TextRange():
 
 
 class TextChildPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtextchildpattern"""
         self.pattern = pattern
@@ -1600,6 +1564,8 @@ class TextChildPattern():
 
 
 class TextEditPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtexteditpattern"""
         self.pattern = pattern
@@ -1628,6 +1594,8 @@ class TextEditPattern():
 
 
 class TextPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtextpattern"""
         self.pattern = pattern
@@ -1660,11 +1628,8 @@ class TextPattern():
         """
         eleArray = self.pattern.GetSelection()
         if eleArray:
-            textRanges = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                textRanges.append(TextRange(textRange=ele))
-            return textRanges
+            getElement = eleArray.GetElement
+            return [TextRange(textRange=getElement(i)) for i in range(eleArray.Length)]
         return []
 
     def GetVisibleRanges(self) -> List[TextRange]:
@@ -1676,11 +1641,8 @@ class TextPattern():
         """
         eleArray = self.pattern.GetVisibleRanges()
         if eleArray:
-            textRanges = []
-            for i in range(eleArray.Length):
-                ele = eleArray.GetElement(i)
-                textRanges.append(TextRange(textRange=ele))
-            return textRanges
+            getElement = eleArray.GetElement
+            return [TextRange(textRange=getElement(i)) for i in range(eleArray.Length)]
         return []
 
     def RangeFromChild(self, child) -> Optional[TextRange]:
@@ -1710,12 +1672,16 @@ class TextPattern():
 
 
 class TextPattern2():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtextpattern2"""
         self.pattern = pattern
 
 
 class TogglePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtogglepattern"""
         self.pattern = pattern
@@ -1751,6 +1717,8 @@ class TogglePattern():
 
 
 class TransformPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtransformpattern"""
         self.pattern = pattern
@@ -1828,6 +1796,8 @@ class TransformPattern():
 
 
 class TransformPattern2():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationtransformpattern2"""
         self.pattern = pattern
@@ -1900,6 +1870,8 @@ class TransformPattern2():
 
 
 class ValuePattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationvaluepattern"""
         self.pattern = pattern
@@ -1939,6 +1911,8 @@ class ValuePattern():
 
 
 class VirtualizedItemPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationvirtualizeditempattern"""
         self.pattern = pattern
@@ -1957,6 +1931,8 @@ class VirtualizedItemPattern():
 
 
 class WindowPattern():
+    __slots__ = ('pattern',)
+
     def __init__(self, pattern=None):
         """Refer https://docs.microsoft.com/en-us/windows/win32/api/uiautomationclient/nn-uiautomationclient-iuiautomationwindowpattern"""
         self.pattern = pattern
@@ -2099,7 +2075,10 @@ PatternConstructors = {
 
 def CreatePattern(patternId: int, pattern: ctypes.POINTER(comtypes.IUnknown)):
     """Create a concreate pattern by pattern id and pattern(POINTER(IUnknown))."""
-    subPattern = pattern.QueryInterface(GetPatternIdInterface(patternId))
+    patternInterface = GetPatternIdInterface(patternId)
+    if patternInterface is None:
+        return None
+    subPattern = pattern.QueryInterface(patternInterface)
     if subPattern:
         return PatternConstructors[patternId](pattern=subPattern)
 